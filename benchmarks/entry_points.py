@@ -0,0 +1,74 @@
+"""Measure the time spent discovering plugins via entry points in an environment
+with a large number of installed distributions, with and without the cache
+controlled by ``VALIDATE_PYPROJECT_CACHE_DIR``.
+
+Usage::
+
+    python benchmarks/entry_points.py --distributions 600 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+HERE = Path(__file__).parent.resolve()
+PROJECT = HERE.parent
+
+SCRIPT = """
+import time
+t0 = time.perf_counter()
+from validate_pyproject import plugins
+plugins.list_from_entry_points()
+print(time.perf_counter() - t0)
+"""
+
+
+def make_distributions(site: Path, number: int) -> None:
+    for i in range(number):
+        dist_info = site / f"fake_dist_{i}-1.0.dist-info"
+        dist_info.mkdir(parents=True)
+        metadata = f"Metadata-Version: 2.1\nName: fake-dist-{i}\nVersion: 1.0\n"
+        dist_info.joinpath("METADATA").write_text(metadata, encoding="utf-8")
+        entry_points = f"[console_scripts]\nfake-{i} = fake_dist_{i}:main\n"
+        dist_info.joinpath("entry_points.txt").write_text(entry_points, "utf-8")
+
+
+def run(site: Path, cache_dir: str | None) -> float:
+    env = {k: v for k, v in os.environ.items() if k != "VALIDATE_PYPROJECT_CACHE_DIR"}
+    env["PYTHONPATH"] = os.pathsep.join([str(site), str(PROJECT / "src")])
+    if cache_dir:
+        env["VALIDATE_PYPROJECT_CACHE_DIR"] = cache_dir
+    cmd = [sys.executable, "-c", SCRIPT]
+    return float(subprocess.check_output(cmd, env=env, text=True))  # noqa: S603
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--distributions", type=int, default=600)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        site = Path(tmp, "site")
+        make_distributions(site, args.distributions)
+        cache_dir = str(Path(tmp, "cache"))
+        run(site, cache_dir)  # populate cache
+        results = {
+            "distributions": args.distributions,
+            "uncached": statistics.median(run(site, None) for _ in range(args.repeat)),
+            "cached": statistics.median(
+                run(site, cache_dir) for _ in range(args.repeat)
+            ),
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Measure the cost of each ``ValidationError`` raised for the documents in
+``tests/invalid-examples``, when the error is discarded (e.g. caught and re-raised
+by a build backend) and when its message is displayed, with and without DEBUG
+logging (which adds the ``details`` to the message).
+``not_raised`` is the cost of the validation itself (:meth:`Validator.is_valid`,
+which never creates a ``ValidationError``), so it is a control for the noise.
+
+The scenarios are interleaved (each round runs all of them once) and the median of
+the rounds is reported, so that changes in the load of the machine affect all the
+scenarios alike.
+
+Usage::
+
+    python benchmarks/error_formatting.py --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import statistics
+import time
+from functools import partial
+from pathlib import Path
+
+from validate_pyproject import _tomllib as tomllib
+from validate_pyproject import api
+from validate_pyproject.error_reporting import ValidationError
+
+HERE = Path(__file__).parent.resolve()
+PROJECT = HERE.parent
+
+
+def load_documents(validator: api.Validator) -> list[dict]:
+    """Invalid examples that do not depend on external tools (``--tool``/``--store``)"""
+    examples = sorted((PROJECT / "tests/invalid-examples").glob("**/*.toml"))
+    documents = [tomllib.loads(p.read_text(encoding="utf-8")) for p in examples]
+    return [doc for doc in documents if not validator.is_valid(doc)]
+
+
+def check(validator: api.Validator, document: dict, *, display: bool | None) -> None:
+    if display is None:  # reference: no ``ValidationError`` is created
+        validator.is_valid(document)
+        return
+    try:
+        validator(document)
+    except ValidationError as ex:
+        if display:
+            str(ex)
+
+
+def check_all(
+    validator: api.Validator, documents: list[dict], *, display: bool | None
+) -> None:
+    for doc in documents:
+        check(validator, doc, display=display)
+
+
+SCENARIOS = {
+    "not_raised": (None, logging.WARNING),
+    "discarded": (False, logging.WARNING),
+    "displayed": (True, logging.WARNING),
+    "displayed_debug": (True, logging.DEBUG),
+}
+
+
+def per_error(validator: api.Validator, documents: list[dict], repeat: int) -> dict:
+    logger = logging.getLogger("validate_pyproject")
+    timings: dict[str, list[float]] = {name: [] for name in SCENARIOS}
+    for i in range(repeat + 1):  # the first round is a warm-up
+        for name, (display, level) in SCENARIOS.items():
+            logger.setLevel(level)
+            run = partial(check_all, validator, documents, display=display)
+            start = time.perf_counter()
+            run()
+            if i:
+                timings[name].append(time.perf_counter() - start)
+    logger.setLevel(logging.NOTSET)
+    # microseconds
+    return {k: statistics.median(v) / len(documents) * 1e6 for k, v in timings.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    validator = api.Validator()
+    documents = load_documents(validator)
+    results = {
+        "errors": len(documents),
+        "us_per_error": per_error(validator, documents, args.repeat),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
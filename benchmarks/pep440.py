@@ -0,0 +1,77 @@
+"""Compare :func:`~validate_pyproject.formats.pep440` with the reference regular
+expression (``VERSION_REGEX``) on real version strings: the versions of the installed
+distributions and the ones in ``tests/examples`` (or the lines of ``--corpus FILE``,
+e.g. a dump of the versions published on PyPI).
+
+Usage::
+
+    python benchmarks/pep440.py --repeat 20
+    python benchmarks/pep440.py --corpus versions.txt
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from importlib import metadata
+from pathlib import Path
+from typing import Callable
+
+from validate_pyproject import _tomllib as tomllib
+from validate_pyproject import formats
+
+HERE = Path(__file__).parent.resolve()
+PROJECT = HERE.parent
+
+
+def load_versions(corpus: Path | None) -> list[str]:
+    if corpus:
+        return corpus.read_text(encoding="utf-8").splitlines()
+    versions = [dist.version for dist in metadata.distributions()]
+    for path in sorted((PROJECT / "tests").glob("*examples/**/*.toml")):
+        doc = tomllib.loads(path.read_text(encoding="utf-8"))
+        version = doc.get("project", {}).get("version")
+        if isinstance(version, str):
+            versions.append(version)
+    return versions
+
+
+def regex(value: str) -> bool:
+    return formats.VERSION_REGEX.match(value) is not None
+
+
+def check_all(fn: Callable[[str], object], values: list[str]) -> None:
+    for value in values:
+        fn(value)
+
+
+def per_version(versions: list[str], repeat: int) -> dict:
+    results = {}
+    for name, fn in [("regex", regex), ("scanner", formats.pep440)]:
+        check_all(fn, versions)  # warm-up
+        timer = timeit.Timer(lambda fn=fn: check_all(fn, versions))
+        best = min(timer.repeat(number=1, repeat=repeat))
+        results[name] = best / len(versions) * 1e6  # microseconds
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--corpus", type=Path, help="File with one version per line")
+    args = parser.parse_args()
+
+    versions = load_versions(args.corpus)
+    mismatches = [v for v in versions if formats.pep440(v) != regex(v)]
+    results = {
+        "versions": len(versions),
+        "valid": sum(map(regex, versions)),
+        "mismatches": mismatches,
+        "us_per_version": per_version(versions, args.repeat),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Measure the cost of validating the dependencies found in ``tests/examples``
+(``build-system.requires``, ``project.dependencies``, ``optional-dependencies`` and
+``dependency-groups``) with the ``pep508`` format:
+
+- ``packaging``: constructing :class:`packaging.requirements.Requirement`,
+- ``uncached``: :func:`~validate_pyproject.formats.pep508` without its LRU cache
+  (regex fast path, falling back to ``packaging``),
+- ``cached``: :func:`~validate_pyproject.formats.pep508` after a first pass.
+
+Usage::
+
+    python benchmarks/pep508.py --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from pathlib import Path
+from typing import Callable
+
+from validate_pyproject import _tomllib as tomllib
+from validate_pyproject import formats
+
+HERE = Path(__file__).parent.resolve()
+PROJECT = HERE.parent
+
+
+def _strings(values: object) -> list[str]:
+    if isinstance(values, str):
+        return [values]
+    if isinstance(values, dict):
+        return [v for group in values.values() for v in _strings(group)]
+    if isinstance(values, list):
+        return [v for item in values for v in _strings(item)]
+    return []
+
+
+def load_requirements() -> list[str]:
+    requirements = []
+    for path in sorted((PROJECT / "tests/examples").glob("**/*.toml")):
+        doc = tomllib.loads(path.read_text(encoding="utf-8"))
+        project = doc.get("project", {})
+        requirements += _strings(doc.get("build-system", {}).get("requires"))
+        requirements += _strings(project.get("dependencies"))
+        requirements += _strings(project.get("optional-dependencies"))
+        requirements += _strings(doc.get("dependency-groups"))
+    return [r for r in requirements if formats.pep508.__wrapped__(r)]
+
+
+def check_all(fn: Callable[[str], object], values: list[str]) -> None:
+    for value in values:
+        fn(value)
+
+
+def per_requirement(requirements: list[str], repeat: int) -> dict:
+    def packaging(value: str) -> None:
+        formats._req.Requirement(value)
+
+    results = {}
+    for name, fn in [
+        ("packaging", packaging),
+        ("uncached", formats.pep508.__wrapped__),
+        ("cached", formats.pep508),
+    ]:
+        check_all(fn, requirements)  # warm-up
+        timer = timeit.Timer(lambda fn=fn: check_all(fn, requirements))
+        best = min(timer.repeat(number=1, repeat=repeat))
+        results[name] = best / len(requirements) * 1e6  # microseconds
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    requirements = load_requirements()
+    fast = [r for r in requirements if formats.PEP508_SIMPLE_REGEX.fullmatch(r)]
+    results = {
+        "requirements": len(requirements),
+        "fast_path": len(fast),
+        "us_per_requirement": per_requirement(requirements, args.repeat),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
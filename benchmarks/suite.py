@@ -0,0 +1,352 @@
+"""Benchmark suite over the example corpus (``tests/examples`` and
+``tests/invalid-examples``), covering the construction and compilation of
+validators, the validation of each document, the formatting of errors, the
+``pre_compile`` code generation, the import of the embedded validator and the
+start-up of the CLI.
+
+The suite runs offline: the external schemas required by the ``test_config.json``
+files are read from ``VALIDATE_PYPROJECT_CACHE_REMOTE`` (populated with
+``tools/cache_urls_for_tests.py``), and examples whose schemas are not cached are
+skipped. The results are stored as JSON, so they can be compared between commits.
+
+Usage::
+
+    python benchmarks/suite.py --output before.json
+    git switch other-branch
+    python benchmarks/suite.py --output after.json --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+import fastjsonschema as FJS
+
+from validate_pyproject import __version__, api, http
+from validate_pyproject import _tomllib as tomllib
+from validate_pyproject.error_reporting import ValidationError
+from validate_pyproject.pre_compile import pre_compile
+from validate_pyproject.remote import RemotePlugin, load_store
+
+HERE = Path(__file__).parent.resolve()
+PROJECT = HERE.parent
+CLI_EXAMPLE = PROJECT / "tests/examples/simple/pep639.toml"
+EMBEDDED = "_benchmark_embedded"
+
+TIMER = """
+import sys, time
+t0 = time.perf_counter()
+exec(sys.argv[1])
+print(time.perf_counter() - t0)
+"""
+
+
+class Case(NamedTuple):
+    path: Path
+    document: dict
+    validator: api.Validator
+
+
+class Corpus(NamedTuple):
+    valid: list[Case]
+    invalid: list[Case]
+    skipped: list[str]
+
+
+class Context(NamedTuple):
+    corpus: Corpus
+    repeat: int
+    tmp: Path
+
+
+BENCHMARKS: dict[str, Callable[[Context], dict[str, Any]]] = {}
+
+
+def benchmark(name: str) -> Callable:
+    def _register(fn: Callable[[Context], dict[str, Any]]) -> Callable:
+        BENCHMARKS[name] = fn
+        return fn
+
+    return _register
+
+
+def _offline(url: str) -> Any:
+    msg = f"{url} is not cached (see tools/cache_urls_for_tests.py)"
+    raise OSError(msg)
+
+
+def load_tools(example: Path) -> tuple[RemotePlugin, ...]:
+    config_file = example.with_name("test_config.json")
+    if not config_file.exists():
+        return ()
+    config = json.loads(config_file.read_text(encoding="utf-8"))
+    tools = [RemotePlugin.from_url(k, v) for k, v in config.get("tools", {}).items()]
+    if config.get("store"):
+        tools.extend(load_store(config["store"]))
+    return tuple(tools)
+
+
+def load_corpus() -> Corpus:
+    corpus = Corpus([], [], [])
+    validators: dict[tuple[str, ...], api.Validator] = {}
+    for kind, cases in [
+        ("examples", corpus.valid),
+        ("invalid-examples", corpus.invalid),
+    ]:
+        for path in sorted((PROJECT / "tests" / kind).glob("**/*.toml")):
+            try:
+                tools = load_tools(path)
+            except (OSError, ValueError) as ex:
+                corpus.skipped.append(f"{path.relative_to(PROJECT)}: {ex}")
+                continue
+            key = tuple(sorted(t.id for t in tools))
+            if key not in validators:
+                validators[key] = api.Validator(extra_plugins=tools)
+            document = tomllib.loads(path.read_text(encoding="utf-8"))
+            cases.append(Case(path, document, validators[key]))
+    return corpus
+
+
+def measure(fn: Callable[[], object], repeat: int, per: int = 1) -> dict[str, Any]:
+    fn()  # warm-up
+    times = [t / per for t in timeit.repeat(fn, number=1, repeat=repeat)]
+    return summarise(times)
+
+
+def measure_process(
+    code: str, repeat: int, env: dict[str, str] | None = None
+) -> dict[str, Any]:
+    """Time ``code`` in a new interpreter (measured from inside the process)"""
+    cmd = [sys.executable, "-c", TIMER, code]
+    times = [
+        float(subprocess.check_output(cmd, env=env, cwd=PROJECT, text=True))  # noqa: S603
+        for _ in range(repeat)
+    ]
+    return summarise(times)
+
+
+def measure_command(
+    args: list[str], repeat: int, env: dict[str, str] | None = None
+) -> dict[str, Any]:
+    """Wall-clock time of a command (including the interpreter start-up)"""
+    times = []
+    for _ in range(repeat):
+        start = timeit.default_timer()
+        subprocess.run(args, env=env, cwd=PROJECT, capture_output=True, check=True)  # noqa: S603
+        times.append(timeit.default_timer() - start)
+    return summarise(times)
+
+
+def summarise(times: list[float]) -> dict[str, Any]:
+    return {"min": min(times), "median": statistics.median(times), "runs": len(times)}
+
+
+def environment(**extra: str) -> dict[str, str]:
+    env = {k: v for k, v in os.environ.items() if k != "VALIDATE_PYPROJECT_CACHE_DIR"}
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(PROJECT / "src"), *filter(None, [env.get("PYTHONPATH")])]
+    )
+    return {**env, **extra}
+
+
+# ---- Benchmarks ----
+
+
+@benchmark("validator.construct.cold")
+def construct_cold(ctx: Context) -> dict[str, Any]:
+    code = "from validate_pyproject import api; api.Validator()"
+    return measure_process(code, ctx.repeat, environment())
+
+
+@benchmark("validator.construct.warm")
+def construct_warm(ctx: Context) -> dict[str, Any]:
+    return measure(api.Validator, ctx.repeat)
+
+
+@benchmark("validator.compile")
+def compile_code(ctx: Context) -> dict[str, Any]:
+    validator = api.Validator()
+    return measure(
+        lambda: validator._compile_schema(validator.schema, None), ctx.repeat
+    )
+
+
+@benchmark("validator.compile.cached")
+def compile_cached(ctx: Context) -> dict[str, Any]:
+    validator = api.Validator(cache_dir=ctx.tmp / "cache")
+    path = validator._compiled_path()
+    return measure(
+        lambda: validator._compile_schema(validator.schema, path), ctx.repeat
+    )
+
+
+@benchmark("validate.valid")
+def validate_valid(ctx: Context) -> dict[str, Any]:
+    cases = ctx.corpus.valid
+
+    def run() -> None:
+        for case in cases:
+            case.validator(case.document)
+
+    return {**measure(run, ctx.repeat, per=len(cases)), "documents": len(cases)}
+
+
+@benchmark("validate.invalid")
+def validate_invalid(ctx: Context) -> dict[str, Any]:
+    cases = [c for c in ctx.corpus.invalid if not c.validator.is_valid(c.document)]
+
+    def run() -> None:
+        for case in cases:
+            with suppress(ValidationError):
+                case.validator(case.document)
+
+    return {**measure(run, ctx.repeat, per=len(cases)), "documents": len(cases)}
+
+
+@benchmark("errors.format")
+def format_errors(ctx: Context) -> dict[str, Any]:
+    raw = []
+    for case in ctx.corpus.invalid:
+        try:
+            case.validator._validation_fn()(case.document)
+        except FJS.JsonSchemaValueException as ex:  # noqa: PERF203
+            raw.append(ex)
+
+    def run() -> None:
+        for ex in raw:
+            error = ValidationError._from_jsonschema(ex)
+            str(error), error.details
+
+    return {**measure(run, ctx.repeat, per=len(raw)), "errors": len(raw)}
+
+
+@benchmark("pre_compile.generate")
+def generate(ctx: Context) -> dict[str, Any]:
+    out = ctx.tmp / EMBEDDED
+    return measure(lambda: pre_compile(out), ctx.repeat)
+
+
+@benchmark("pre_compile.import")
+def import_embedded(ctx: Context) -> dict[str, Any]:
+    pre_compile(ctx.tmp / EMBEDDED)
+    env = environment(PYTHONPATH=str(ctx.tmp))
+    return measure_process(f"import {EMBEDDED}", ctx.repeat, env)
+
+
+@benchmark("cli.startup")
+def cli_startup(ctx: Context) -> dict[str, Any]:
+    cmd = [sys.executable, "-m", "validate_pyproject", str(CLI_EXAMPLE)]
+    return measure_command(cmd, ctx.repeat, environment())
+
+
+@benchmark("cli.startup.cached")
+def cli_startup_cached(ctx: Context) -> dict[str, Any]:
+    cmd = [sys.executable, "-m", "validate_pyproject", "--no-cache", str(CLI_EXAMPLE)]
+    env = environment(VALIDATE_PYPROJECT_CACHE_DIR=str(ctx.tmp / "cli-cache"))
+    subprocess.run(cmd, env=env, cwd=PROJECT, capture_output=True, check=True)  # noqa: S603
+    return measure_command(cmd, ctx.repeat, env)
+
+
+# ---- Comparison ----
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> bool:
+    """Print the ratio between the medians, returning ``False`` for regressions"""
+    ok = True
+    print(f"{'benchmark':<28} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for name, result in current["benchmarks"].items():
+        before = baseline["benchmarks"].get(name)
+        if not before:
+            print(f"{name:<28} {'-':>12} {result['median']:>12.6f}")
+            continue
+        ratio = result["median"] / before["median"]
+        flag = "  <-- regression" if ratio > 1 + threshold else ""
+        ok = ok and not flag
+        print(
+            f"{name:<28} {before['median']:>12.6f} {result['median']:>12.6f} "
+            f"{ratio:>7.2f}{flag}"
+        )
+    return ok
+
+
+def metadata() -> dict[str, Any]:
+    try:
+        cmd = ["git", "rev-parse", "--short", "HEAD"]
+        commit = subprocess.check_output(cmd, cwd=PROJECT, text=True).strip()  # noqa: S603
+    except (OSError, subprocess.CalledProcessError):
+        commit = ""
+    return {
+        "commit": commit,
+        "validate_pyproject": __version__,
+        "fastjsonschema": FJS.VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "unit": "seconds",
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "-k",
+        "--filter",
+        default="",
+        help="Only run benchmarks containing the given text in their names",
+    )
+    parser.add_argument("-o", "--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--compare", type=Path, help="JSON file with previous results")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown reported as regression (default: %(default)s)",
+    )
+    args = parser.parse_args()
+
+    os.environ.pop("VALIDATE_PYPROJECT_CACHE_DIR", None)  # measure uncached code paths
+    http.open_url = (
+        _offline  # external schemas only from VALIDATE_PYPROJECT_CACHE_REMOTE
+    )
+
+    corpus = load_corpus()
+    for skipped in corpus.skipped:
+        print(f"Skipping {skipped}", file=sys.stderr)
+
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        ctx = Context(corpus, args.repeat, Path(tmp))
+        for name, fn in BENCHMARKS.items():
+            if args.filter in name:
+                print(f"Running {name}...", file=sys.stderr)
+                results[name] = fn(ctx)
+
+    report = {
+        "metadata": metadata(),
+        "skipped": corpus.skipped,
+        "benchmarks": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        return 0 if compare(baseline, report, args.threshold) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""Most of the build configuration lives in ``pyproject.toml``.
+This file only customises ``build_py`` to ship pre-compiled validation code for the
+built-in plugins (used automatically by ``validate_pyproject.api.Validator``).
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+from setuptools import setup
+from setuptools.command.build_py import build_py
+
+HERE = Path(__file__).parent.resolve()
+BUILTIN_PLUGINS = ("distutils", "setuptools")  # sorted as in `list_from_entry_points`
+
+_logger = logging.getLogger(__name__)
+
+
+class BuildPy(build_py):
+    def run(self) -> None:
+        super().run()
+        if not self.dry_run:
+            self.bundle_validations()
+
+    def bundle_validations(self) -> None:
+        output_dir = Path(self.build_lib, "validate_pyproject", "_precompiled")
+        sys.path.insert(0, str(HERE / "src"))
+        try:
+            from validate_pyproject import api, plugins, pre_compile
+
+            plg = [
+                plugins.PluginWrapper(n, api.load_builtin_plugin)
+                for n in BUILTIN_PLUGINS
+            ]
+            pre_compile.bundle(output_dir, plg)
+        except Exception:  # Not critical: the validation is compiled at runtime
+            _logger.warning("Cannot pre-compile validations", exc_info=True)
+        finally:
+            sys.path.remove(str(HERE / "src"))
+
+
+setup(cmdclass={"build_py": BuildPy})
@@ -4,32 +4,51 @@ Retrieve JSON schemas for validating dicts representing a ``pyproject.toml`` fil
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import importlib
+import inspect
 import json
 import logging
+import threading
 import typing
-from collections.abc import Iterator, Mapping, Sequence
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from enum import Enum
-from functools import partial, reduce
+from functools import cache, partial, reduce
 from types import MappingProxyType, ModuleType
 from typing import (
     Callable,
+    Literal,
+    NamedTuple,
     TypeVar,
 )
 
 import fastjsonschema as FJS
 
-from . import _resources, errors, formats
-from .error_reporting import detailed_errors
+from . import _resources, caching, errors, formats, profiling
+from .error_reporting import ValidationError, detailed_errors
+from .errors import ValidationErrors
 from .extra_validations import EXTRA_VALIDATIONS
+from .profiling import Profile, profile
 from .types import FormatValidationFn, Schema, ValidationFn
 
 _logger = logging.getLogger(__name__)
 
 if typing.TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+
     from .plugins import PluginProtocol
 
 
-__all__ = ["Validator"]
+__all__ = [
+    "Profile",
+    "ValidationResult",
+    "Validator",
+    "get_validator",
+    "invalid_classifiers",
+    "profile",
+]
 
 assert __spec__ is not None
 assert __spec__.parent is not None
@@ -41,6 +60,14 @@ ALL_PLUGINS = AllPlugins.ALL_PLUGINS
 
 TOP_LEVEL_SCHEMA = "pyproject_toml"
 PROJECT_TABLE_SCHEMA = "project_metadata"
+BUNDLED_MODULE = f"{_PARENT}._precompiled"  #: :meta private:
+
+# Keywords that :mod:`fastjsonschema` only checks after the ``properties``
+_CHECKED_AFTER_PROPERTIES = frozenset(
+    ("patternProperties", "additionalProperties", "propertyNames")
+)
+# ``fast_fail=False`` (collect all the errors) is only available in newer versions
+_COLLECTS_ALL_ERRORS = "fast_fail" in inspect.signature(FJS.compile).parameters
 
 
 def _get_public_functions(module: ModuleType) -> Mapping[str, FormatValidationFn]:
@@ -54,9 +81,11 @@ def _get_public_functions(module: ModuleType) -> Mapping[str, FormatValidationFn
 FORMAT_FUNCTIONS = MappingProxyType(_get_public_functions(formats))
 
 
+@cache
 def load(name: str, package: str = _PARENT, ext: str = ".schema.json") -> Schema:
     """Load the schema from a JSON Schema file.
-    The returned dict-like object is immutable.
+    The returned dict-like object is immutable (and shared: each file is only parsed
+    once per process).
 
     :meta private: (low level detail)
     """
@@ -85,10 +114,14 @@ class SchemaRegistry(Mapping[str, Schema]):
         self._schemas: dict[str, tuple[str, str, Schema]] = {}
         # (which part of the TOML, who defines, schema)
 
-        top_level = typing.cast("dict", load(TOP_LEVEL_SCHEMA))  # Make it mutable
+        # Make it mutable (shallow copies, so the cached schema is not affected)
+        top_level = dict(load(TOP_LEVEL_SCHEMA))
         self._spec_version: str = top_level["$schema"]
-        top_properties = top_level["properties"]
-        tool_properties = top_properties["tool"].setdefault("properties", {})
+        top_properties = top_level["properties"] = dict(top_level["properties"])
+        tool_table = top_properties["tool"] = dict(top_properties["tool"])
+        tool_properties = tool_table["properties"] = dict(
+            tool_table.get("properties", {})
+        )
 
         # Add PEP 621
         project_table_schema = load(PROJECT_TABLE_SCHEMA)
@@ -198,28 +231,51 @@ class RefHandler(Mapping[str, Callable[[str], Schema]]):
 
     def __getitem__(self, key: str) -> Callable[[str], Schema]:
         """All the references should be retrieved from the registry"""
-        return self._registry.__getitem__
+        return self._load
+
+    def _load(self, uri: str) -> Schema:
+        # fastjsonschema modifies the schemas in-place (e.g. normalising ``$ref``),
+        # copies avoid corrupting schemas that are cached or shared between validators
+        return copy.deepcopy(self._registry[uri])
 
 
 class Validator:
     _plugins: Sequence[PluginProtocol]
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         plugins: Sequence[PluginProtocol] | AllPlugins = ALL_PLUGINS,
         format_validators: Mapping[str, FormatValidationFn] = FORMAT_FUNCTIONS,
         extra_validations: Sequence[ValidationFn] = EXTRA_VALIDATIONS,
         *,
         extra_plugins: Sequence[PluginProtocol] = (),
+        cache_dir: caching.PathLike | None = None,
+        lazy_tools: bool = False,
+        collect_stats: bool = False,
     ):
         self._code_cache: str | None = None
         self._cache: ValidationFn | None = None
+        self._collecting_cache: Callable[[Mapping], Mapping] | None = None
         self._schema: Schema | None = None
+        self._fingerprint: str | None = None
+        self._cache_dir = cache_dir
+        # Compile ``tool.<name>`` validators only for the tables found in the documents
+        self._lazy_tools = lazy_tools
+        self._root_keys: list[str] = []
+        self._tool_schemas: dict[str, Schema] = {}
+        self._tool_validators: dict[str, ValidationFn] = {}
 
         # Let's make the following options readonly
         self._format_validators = MappingProxyType(format_validators)
         self._extra_validations = tuple(extra_validations)
 
+        # Format functions given to the validation code (counting calls, if requested)
+        self._format_stats: dict[str, profiling.FormatStats] = {}
+        self._runtime_formats: Mapping[str, FormatValidationFn] = self.formats
+        if collect_stats:
+            formats, self._format_stats = profiling.counted_formats(self.formats)
+            self._runtime_formats = MappingProxyType(formats)
+
         if plugins is ALL_PLUGINS:
             from .plugins import list_from_entry_points
 
@@ -227,7 +283,8 @@ class Validator:
 
         self._plugins = (*plugins, *extra_plugins)
 
-        self._schema_registry = SchemaRegistry(self._plugins)
+        with profiling.phase("registry"):
+            self._schema_registry = SchemaRegistry(self._plugins)
         self.handlers = RefHandler(self._schema_registry)
 
     @property
@@ -249,31 +306,446 @@ class Validator:
         """Mapping between JSON Schema formats and functions that validates them"""
         return self._format_validators
 
+    @property
+    def fingerprint(self) -> str:
+        """Stable hash identifying the code generated for the validation.
+        It takes into consideration all the registered schemas, the names of the
+        format functions and the version of :mod:`fastjsonschema`.
+        """
+        if self._fingerprint is None:
+            digest = hashlib.sha256(FJS.VERSION.encode())
+            for sid, schema in self._schema_registry.items():
+                digest.update(_dumps([sid, schema]))
+            digest.update(json.dumps(sorted(self.formats)).encode())
+            self._fingerprint = digest.hexdigest()
+
+        return self._fingerprint
+
     @property
     def generated_code(self) -> str:
         if self._code_cache is None:
-            fmts = dict(self.formats)
-            self._code_cache = FJS.compile_to_code(
-                self.schema, self.handlers, fmts, use_default=False
-            )
+            path = self._compiled_path()
+            if path and path.exists():
+                self._code_cache = path.read_text(encoding="utf-8")
+            else:
+                self._code_cache = self._generate_code(self.schema)
 
         return self._code_cache
 
+    def _generate_code(
+        self,
+        schema: Schema,
+        handlers: RefHandler | None = None,
+        *,
+        fast_fail: bool = True,
+    ) -> str:
+        fmts = dict(self.formats)
+        handlers = handlers or self.handlers
+        options = {} if fast_fail else {"fast_fail": False}
+        code: str = FJS.compile_to_code(
+            schema, handlers, fmts, use_default=False, **options
+        )
+        return code
+
+    def _compiled_path(
+        self, schema: Schema | None = None, suffix: str = ""
+    ) -> Path | None:
+        cache_dir = caching.local_dir("compiled", self._cache_dir)
+        if not cache_dir:
+            return None
+        if schema is None:
+            return cache_dir / f"fjs_{self.fingerprint}{suffix}.py"
+        partial_id = hashlib.sha256(_dumps(schema)).hexdigest()[:16]
+        return cache_dir / f"fjs_{self.fingerprint}_{partial_id}{suffix}.py"
+
+    def _validation_fn(self) -> ValidationFn:
+        if self._cache is None:
+            with profiling.phase("compile"):
+                lazy = self._lazy_tools
+                self._cache = self._compile_lazy() if lazy else self._compile()
+        return self._cache
+
+    def _load_bundled(self) -> ValidationFn | None:
+        try:
+            bundled = importlib.import_module(BUNDLED_MODULE)
+        except ImportError:
+            return None
+        if getattr(bundled, "FINGERPRINT", None) != self.fingerprint:
+            return None
+        _logger.debug(f"Using pre-compiled validation code from {BUNDLED_MODULE}")
+        module = importlib.import_module(f"{BUNDLED_MODULE}.validations")
+        fn = partial(module.validate, custom_formats=self._runtime_formats)
+        return typing.cast("ValidationFn", fn)
+
+    def _compile(self) -> ValidationFn:
+        bundled = self._load_bundled()
+        if bundled:
+            return bundled
+
+        return self._compile_schema(self.schema, self._compiled_path())
+
+    def _compile_schema(
+        self,
+        schema: Schema,
+        path: Path | None,
+        handlers: RefHandler | None = None,
+        *,
+        fast_fail: bool = True,
+        **kwargs: str,
+    ) -> ValidationFn:
+        fn: Callable | None = None
+        if path:
+            try:
+                code = partial(
+                    self._generate_code, schema, handlers, fast_fail=fast_fail
+                )
+                fn = caching.as_module(code, path).validate
+            except Exception:
+                _logger.debug(f"Cannot reuse {path}, compiling again", exc_info=True)
+
+        if fn is None:
+            fmts = dict(self.formats)
+            handlers = handlers or self.handlers
+            options = {} if fast_fail else {"fast_fail": False}
+            fn = FJS.compile(schema, handlers, fmts, use_default=False, **options)
+
+        validate = partial(fn, custom_formats=self._runtime_formats, **kwargs)
+        return typing.cast("ValidationFn", validate)
+
+    def _compile_lazy(self) -> ValidationFn:
+        """Compile the top level schema without the ``tool.<name>`` subtables
+        (which are compiled on demand, see :meth:`_tool_validator`).
+        """
+        main = self.registry.main
+        top_level = copy.deepcopy(dict(self[main]))
+        self._tool_schemas = top_level["properties"]["tool"].pop("properties", {})
+        self._root_keys = list(top_level["properties"])
+        handlers = RefHandler({**self.registry, main: Schema(top_level)})
+        path = self._compiled_path(Schema(top_level))
+        validate_root = self._compile_schema(self.schema, path, handlers)
+        return partial(self._validate_lazily, validate_root)
+
+    def _tool_validator(self, name: str) -> ValidationFn:
+        if name not in self._tool_validators:
+            _logger.debug(f"Compiling validation code for `tool.{name}`")
+            prefix = f"data.tool.{name}"
+            schema = Schema(self._tool_schemas[name])
+            path = self._compiled_path(schema)
+            with profiling.phase("compile"):
+                fn = self._compile_schema(schema, path, name_prefix=prefix)
+            self._tool_validators[name] = fn
+        return self._tool_validators[name]
+
+    def _validate_lazily(
+        self, validate_root: Callable, pyproject: T, **kwargs: object
+    ) -> T:
+        # Errors must be identical to the ones raised by the monolithic validator,
+        # so the order in which the checks are performed has to be preserved.
+        pending: FJS.JsonSchemaValueException | None = None
+        try:
+            validate_root(pyproject, **kwargs)
+        except FJS.JsonSchemaValueException as ex:
+            if self._precedes_tools(ex):
+                raise
+            pending = ex
+
+        tools = pyproject.get("tool", {})
+        for name in self._tool_schemas:
+            if name in tools:
+                validate_tool: Callable = self._tool_validator(name)
+                validate_tool(tools[name], **kwargs)
+
+        if pending:
+            raise pending
+        return pyproject
+
+    def _precedes_tools(self, ex: FJS.JsonSchemaValueException) -> bool:
+        """Check if the error would be found before the ``tool`` subtables are
+        validated by the monolithic validator.
+        """
+        for i, key in enumerate(self._root_keys):
+            if _is_within(ex.name, f"data.{key}"):
+                return i <= self._root_keys.index("tool")
+        # Error in the top level table itself (e.g. ``type``)
+        return ex.rule not in _CHECKED_AFTER_PROPERTIES
+
+    def _collecting_fn(self) -> Callable[[Mapping], Mapping]:
+        """Validation function that reports all the JSON Schema violations at once
+        (raising :exc:`~validate_pyproject.errors.ValidationErrors`).
+        """
+        if self._collecting_cache is None:
+            if _COLLECTS_ALL_ERRORS:
+                path = self._compiled_path(suffix="_all")
+                with profiling.phase("compile"):
+                    compiled = self._compile_schema(self.schema, path, fast_fail=False)
+                fn = partial(_validate_collecting, compiled)
+            else:  # pragma: no cover
+                _logger.debug(f"fastjsonschema {FJS.VERSION} stops at the first error")
+                fn = partial(_validate_sectionwise, self._validation_fn())
+            self._collecting_cache = fn
+        return self._collecting_cache
+
+    def _all_errors(self, pyproject: Mapping) -> list[ValidationError]:
+        found: list[ValidationError] = []
+        validate = self._profiled(self._collecting_fn())
+        try:
+            with profiling.phase("schema"):
+                validate(pyproject)
+        except ValidationErrors as ex:
+            found.extend(ex.errors)
+
+        for fn in self.extra_validations:
+            try:
+                with profiling.phase("extra_validations"):
+                    fn(pyproject)
+            except FJS.JsonSchemaValueException as ex:  # noqa: PERF203
+                # Same names and messages as in ``detailed_errors``
+                found.append(ValidationError._from_jsonschema(ex))
+            except Exception:
+                # Extra validations assume a document that follows the schema
+                if not found:
+                    raise
+                _logger.debug(f"Skipping {fn.__name__}", exc_info=True)
+        return found
+
+    def _profiled(self, validate: Callable) -> Callable:
+        """Record the time spent in the format functions (only when profiling)"""
+        if not profiling.enabled():
+            return validate
+        formats = profiling.timed_formats(self._runtime_formats)
+        return partial(validate, custom_formats=formats)
+
+    def stats(self) -> dict[str, dict[str, typing.Any]]:
+        """Number of calls, cache hits and cumulative time (in seconds) of each format
+        function, e.g. ``{"pep508": {"calls": 42, "hits": 0, "seconds": 0.001}}``.
+        Only available for validators created with ``collect_stats=True``
+        (otherwise an empty :obj:`dict` is returned).
+        """
+        return {name: s.as_dict() for name, s in self._format_stats.items()}
+
     def __getitem__(self, schema_id: str) -> Schema:
         """Retrieve a schema from registry"""
         return self._schema_registry[schema_id]
 
-    def __call__(self, pyproject: T) -> T:
+    def __call__(
+        self, pyproject: T, *, collect: Literal["first", "all"] = "first"
+    ) -> T:
         """Checks a parsed ``pyproject.toml`` file (given as :obj:`typing.Mapping`)
         and raises an exception when it is not a valid.
+
+        By default, the validation stops at the first error. With ``collect="all"``
+        every violation (in the ``project``, ``build-system`` and ``tool`` tables, and
+        found by the :attr:`extra_validations`) is reported at once via
+        :exc:`~validate_pyproject.errors.ValidationErrors`.
         """
-        if self._cache is None:
-            compiled = FJS.compile(
-                self.schema, self.handlers, dict(self.formats), use_default=False
+        if collect not in ("first", "all"):
+            msg = f"`collect` should be 'first' or 'all', not {collect!r}"
+            raise ValueError(msg)
+        if collect == "all":
+            found = self._all_errors(pyproject)
+            if found:
+                raise ValidationErrors(found, pyproject)
+            return pyproject
+
+        validate = self._profiled(self._validation_fn())
+        with detailed_errors():
+            with profiling.phase("schema"):
+                validate(pyproject)
+            with profiling.phase("extra_validations"):
+                return reduce(
+                    lambda acc, fn: fn(acc), self.extra_validations, pyproject
+                )
+
+    def is_valid(self, pyproject: Mapping) -> bool:
+        """Checks a parsed ``pyproject.toml`` file without formatting any error
+        message, for when only a yes/no answer is needed.
+        """
+        validate = self._validation_fn()
+        try:
+            validate(pyproject)
+            reduce(lambda acc, fn: fn(acc), self.extra_validations, pyproject)
+        except FJS.JsonSchemaValueException:
+            return False
+        return True
+
+    def validate_many(self, documents: Iterable[Mapping]) -> Iterator[ValidationResult]:
+        """Check several parsed ``pyproject.toml`` files, yielding one
+        :class:`ValidationResult` per document (in the same order) instead of raising
+        exceptions. The error messages are only formatted when requested.
+        """
+        validate = self._validation_fn()
+        extra_validations = self.extra_validations
+        for position, pyproject in enumerate(documents):
+            try:
+                validate(pyproject)
+                reduce(lambda acc, fn: fn(acc), extra_validations, pyproject)
+            except FJS.JsonSchemaValueException as ex:  # noqa: PERF203
+                # Keep the type of the errors raised by the extra validations
+                cls = type(ex) if isinstance(ex, ValidationError) else ValidationError
+                error = cls._from_jsonschema(ex)  # message only formatted on demand
+                yield ValidationResult(
+                    position,
+                    ok=False,
+                    name=ex.name,
+                    rule=ex.rule,
+                    exception=ex,
+                    error=error,
+                )
+            else:
+                yield ValidationResult(position, ok=True)
+
+
+class ValidationResult(NamedTuple):
+    """Outcome of the validation of a single document in
+    :meth:`Validator.validate_many`.
+    """
+
+    position: int
+    """Index of the document in the iterable given to :meth:`Validator.validate_many`"""
+    ok: bool
+    name: str = ""
+    """Path to the offending value (e.g. ``data.project.name``)"""
+    rule: str = ""
+    """JSON Schema keyword (or specification) violated by the document"""
+    exception: FJS.JsonSchemaValueException | None = None
+    """Raw exception, without the improved error messages"""
+    error: ValidationError | None = None
+    """Exception with the same message :meth:`Validator.__call__` would produce
+    (formatted on demand)
+    """
+
+
+class _SharedValidators:
+    """Bounded LRU registry of compiled :class:`Validator` objects, keyed by the
+    identity of the plugins used to create them.
+
+    :meta private: (low level detail)
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._validators: OrderedDict[tuple, Validator] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        plugins: Sequence[PluginProtocol] | AllPlugins,
+        extra_plugins: Sequence[PluginProtocol],
+        *,
+        lazy_tools: bool = False,
+    ) -> Validator:
+        key = (_plugins_key(plugins), _plugins_key(extra_plugins), lazy_tools)
+        with self._lock:
+            if key in self._validators:
+                self._validators.move_to_end(key)
+                return self._validators[key]
+
+            validator = Validator(
+                plugins, extra_plugins=extra_plugins, lazy_tools=lazy_tools
             )
-            fn = partial(compiled, custom_formats=self._format_validators)
-            self._cache = typing.cast("ValidationFn", fn)
+            validator._validation_fn()  # Make sure it is compiled before sharing
+            self._validators[key] = validator
+            if len(self._validators) > self.maxsize:
+                self._validators.popitem(last=False)
+            return validator
+
+    def clear(self) -> None:
+        with self._lock:
+            self._validators.clear()
+
+
+def _plugins_key(plugins: Sequence[PluginProtocol] | AllPlugins) -> tuple:
+    if isinstance(plugins, AllPlugins):
+        return (plugins,)
+    # Remote/stored plugins with the same ``$id`` may still carry different schemas
+    return tuple(
+        (p.id, p.tool, p.fragment, hashlib.sha256(_dumps(p.schema)).hexdigest())
+        for p in plugins
+    )
+
+
+def _validate_sectionwise(validate: Callable, pyproject: T, **kwargs: object) -> T:
+    """Emulate ``fast_fail=False`` for older versions of :mod:`fastjsonschema`,
+    by validating the document again without each section (``project``,
+    ``build-system``, ``tool.<name>``, ...) in which an error is found.
+    """
+    found: list[FJS.JsonSchemaValueException] = []
+    remaining = dict(pyproject)
+    while True:
+        try:
+            validate(remaining, **kwargs)
+        except FJS.JsonSchemaValueException as ex:  # noqa: PERF203
+            found.append(ex)
+            if not _remove_section(remaining, ex.name):
+                break
+        else:
+            break
+    if found:
+        collected = [ValidationError._from_jsonschema(ex) for ex in found]
+        raise ValidationErrors(collected, pyproject)
+    return pyproject
+
+
+def _validate_collecting(validate: Callable, pyproject: T, **kwargs: object) -> T:
+    """Run a validation function compiled with ``fast_fail=False``, raising the
+    violations as :exc:`~validate_pyproject.errors.ValidationErrors`.
+    """
+    try:
+        validate(pyproject, **kwargs)
+    except FJS.JsonSchemaValuesException as ex:
+        collected = [ValidationError._from_jsonschema(e) for e in ex.errors]
+        raise ValidationErrors(collected, pyproject) from None
+    return pyproject
+
+
+def _remove_section(pyproject: dict, name: str) -> bool:
+    tools = pyproject.get("tool")
+    if isinstance(tools, Mapping):
+        for key in tools:
+            if _is_within(name, f"data.tool.{key}"):
+                pyproject["tool"] = {k: v for k, v in tools.items() if k != key}
+                return True
+    for key in pyproject:
+        if _is_within(name, f"data.{key}"):
+            del pyproject[key]
+            return True
+    return False  # Error in the top level table itself
 
-        with detailed_errors():
-            self._cache(pyproject)
-            return reduce(lambda acc, fn: fn(acc), self.extra_validations, pyproject)
+
+def _is_within(name: str, prefix: str) -> bool:
+    return name == prefix or name.startswith((f"{prefix}.", f"{prefix}["))
+
+
+def _dumps(schema: object) -> bytes:
+    return json.dumps(schema, default=dict).encode()
+
+
+_SHARED_VALIDATORS = _SharedValidators(maxsize=16)
+
+
+def get_validator(
+    plugins: Sequence[PluginProtocol] | AllPlugins = ALL_PLUGINS,
+    *,
+    extra_plugins: Sequence[PluginProtocol] = (),
+    lazy_tools: bool = False,
+) -> Validator:
+    """Process-wide, already compiled :class:`Validator` for the given plugins.
+
+    Equivalent to ``Validator(plugins, extra_plugins=..., lazy_tools=...)``, but the object
+    is shared between all callers using the same set of plugins,
+    so the entry-point discovery, schema registry and compilation only happen once.
+    The least recently used validators are evicted when too many different plugin
+    sets are requested.
+    """
+    return _SHARED_VALIDATORS.get(plugins, extra_plugins, lazy_tools=lazy_tools)
+
+
+def invalid_classifiers(classifiers: Iterable[str]) -> list[str]:
+    """Check several `trove classifiers <https://pypi.org/classifiers/>`_ at once,
+    returning the ones that are not valid (in the given order).
+
+    Private classifiers (``Private :: ...``) are accepted. When the list of classifiers
+    is not available (``trove-classifiers`` is not installed and it cannot be
+    downloaded from PyPI), no classifier is reported as invalid.
+    """
+    return formats._invalid_classifiers(classifiers)
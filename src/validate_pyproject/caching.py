@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import hashlib
+import importlib.util
+import json
 import logging
 import os
+import tempfile
+import time
+from contextlib import suppress
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, Union
 
 if TYPE_CHECKING:
     import io
+    from types import ModuleType
 
 PathLike = Union[str, "os.PathLike[str]"]
 _logger = logging.getLogger(__name__)
@@ -50,3 +56,142 @@ def path_for(arbitrary_id: str, cache: PathLike | None = None) -> Path | None:
     # ^-- Non-crypto context and appending `escaped` should minimise collisions
     return Path(os.path.expanduser(cache_dir), f"{sha1.hexdigest()}-{escaped}")
     # ^-- Intentionally uses `os.path` instead of `pathlib` to avoid exception
+
+
+def local_dir(kind: str, cache: PathLike | None = None) -> Path | None:
+    """Directory where artifacts of the given ``kind`` produced locally (e.g. compiled
+    validation code) can be stored across runs.
+    If neither ``cache`` nor ``VALIDATE_PYPROJECT_CACHE_DIR`` are set, returns ``None``
+    (i.e. the cache is disabled).
+    """
+    cache_dir = cache or os.getenv("VALIDATE_PYPROJECT_CACHE_DIR")
+    if not cache_dir:
+        return None
+    return Path(os.path.expanduser(cache_dir), kind)
+
+
+def write_atomic(path: Path, text: str) -> Path:
+    """Write ``text`` to ``path`` in a way that concurrent readers never observe a
+    partially written file (a temporary file is renamed into place).
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.chmod(tmp, 0o644)  # mkstemp is overly restrictive for cached artifacts
+        os.replace(tmp, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp)
+        raise
+    return path
+
+
+def as_module(fn: Callable[[], str], path: Path) -> ModuleType:
+    """Import the Python code returned by ``fn()`` as a module stored in ``path``.
+    If ``path`` already exists ``fn`` is not called and the existing file is imported
+    instead (the bytecode is also cached by Python's import machinery).
+    """
+    if path.exists():
+        _logger.debug(f"Using cached module from {path}")
+    else:
+        write_atomic(path, fn())
+        _logger.debug(f"Caching module into {path}")
+
+    name = f"_validate_pyproject_cache_{path.stem}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:  # pragma: no cover
+        msg = f"Cannot import {path}"
+        raise ImportError(msg)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class NotModified(Exception):
+    """Raised by the ``download`` functions given to :func:`cached_download` when
+    the server confirms that the cached copy is still current.
+    """
+
+
+def cached_download(
+    download: Callable[[dict[str, str]], str],
+    name: str,
+    ttl: float,
+    *,
+    offline: bool = False,
+    cache: PathLike | None = None,
+) -> str | None:
+    """Return the text obtained with ``download``, storing it in the cache directory
+    (see :func:`local_dir`) for ``ttl`` seconds.
+
+    After that, the cached copy is revalidated: ``download`` receives a :obj:`dict`
+    with the ``ETag``/``Last-Modified`` values stored with the copy, which it should
+    send as a conditional request, and update with the values in the response
+    (raising :exc:`NotModified` when the copy is still current).
+    If the download fails (or ``offline`` is true), the last good copy is used.
+
+    Returns ``None`` only when ``offline`` and there is no copy in the cache.
+    Without a cache directory, it is equivalent to calling ``download({})``
+    (or returning ``None``, if ``offline``).
+    """
+    cache_dir = local_dir("downloads", cache)
+    if not cache_dir:
+        return None if offline else download({})
+
+    path = cache_dir / name
+    meta_path = cache_dir / f"{name}.json"
+    try:
+        age = time.time() - path.stat().st_mtime
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        age, text = float("inf"), None
+
+    if offline or (text is not None and age < ttl):
+        _logger.debug(f"Using cached {name} from {path}")
+        return text
+
+    validators: dict[str, str] = {}
+    if text is not None:
+        with suppress(OSError, ValueError):
+            validators = json.loads(meta_path.read_text(encoding="utf-8"))
+
+    try:
+        new_text = download(validators)
+    except NotModified:
+        _logger.debug(f"Cached {name} is still current")
+        with suppress(OSError):
+            os.utime(path)
+        return text
+    except Exception:
+        if text is None:
+            raise
+        _logger.debug(f"Cannot download {name}, using cached copy", exc_info=True)
+        return text
+
+    with suppress(OSError):
+        write_atomic(path, new_text)
+        write_atomic(meta_path, json.dumps(validators))
+        _logger.debug(f"Caching {name} into {path}")
+    return new_text
+
+
+def download_stamp(name: str, cache: PathLike | None = None) -> str:
+    """Identify the copy of ``name`` stored by :func:`cached_download`, without
+    reading or revalidating it (empty if there is no copy).
+    The ``ETag``/``Last-Modified`` values are used when available (they are kept
+    when the copy is revalidated), otherwise the size and modification time.
+    """
+    cache_dir = local_dir("downloads", cache)
+    try:
+        info = (cache_dir / name).stat() if cache_dir else None
+    except OSError:
+        info = None
+    if not cache_dir or not info:
+        return ""
+    with suppress(OSError, ValueError):
+        validators = json.loads((cache_dir / f"{name}.json").read_text("utf-8"))
+        if validators:
+            return json.dumps(validators, sort_keys=True)
+    return f"{info.st_size}:{info.st_mtime_ns}"
@@ -7,30 +7,40 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import io
 import json
 import logging
+import os
 import sys
-from contextlib import contextmanager
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from importlib import metadata
 from itertools import chain
+from pathlib import Path
 from textwrap import dedent, wrap
 from typing import (
     TYPE_CHECKING,
     Callable,
     NamedTuple,
+    NoReturn,
+    Optional,
     TypeVar,
+    cast,
 )
 
-from . import __version__
+from . import __version__, caching, formats, profiling
 from . import _tomllib as tomllib
-from .api import Validator
+from .api import Validator, get_validator
 from .errors import ValidationError
-from .plugins import PluginProtocol, PluginWrapper
+from .plugins import PluginProtocol, PluginWrapper, StoredPlugin
 from .plugins import list_from_entry_points as list_plugins_from_entry_points
 from .remote import RemotePlugin, load_store
 
 if TYPE_CHECKING:
-    import io
-    from collections.abc import Generator, Iterator, Sequence
+    from collections.abc import Generator, Iterable, Iterator, Sequence
+    from importlib.metadata import EntryPoint
 
 assert __spec__ is not None
 assert __spec__.parent is not None
@@ -39,6 +49,10 @@ _logger = logging.getLogger(__spec__.parent)
 T = TypeVar("T", bound=NamedTuple)
 
 _REGULAR_EXCEPTIONS = (ValidationError, tomllib.TOMLDecodeError)
+_TOOL_GROUP = "validate_pyproject.tool_schema"
+_FORMAT_DISTRIBUTIONS = ("fastjsonschema", "packaging", "trove-classifiers")
+_SKIP_DIRS = frozenset(("__pycache__", "node_modules", "site-packages"))
+_IN_FLIGHT_PER_JOB = 4  # files submitted to each process ahead of time (--jobs)
 
 
 @contextmanager
@@ -54,6 +68,31 @@ def critical_logging() -> Generator[None, None, None]:
 
 _STDIN = argparse.FileType("r", encoding="utf-8")("-")
 
+
+def _input_file(value: str) -> Path | io.TextIOBase:
+    # Files are only opened when validated (avoid running out of file descriptors)
+    return cast("io.TextIOBase", _STDIN) if value == "-" else Path(value)
+
+
+def _directory(value: str) -> Path:
+    path = Path(value)
+    if not path.is_dir():
+        msg = f"{value!r} is not a directory"
+        raise argparse.ArgumentTypeError(msg)
+    return path
+
+
+def _jobs(value: str) -> int:
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = -1
+    if jobs < 0:
+        msg = f"{value!r} is not a non-negative integer"
+        raise argparse.ArgumentTypeError(msg)
+    return jobs
+
+
 META: dict[str, dict] = {
     "version": dict(
         flags=("-V", "--version"),
@@ -64,9 +103,19 @@ META: dict[str, dict] = {
         dest="input_file",
         nargs="*",
         # default=[_STDIN],  # postponed to facilitate testing
-        type=argparse.FileType("r", encoding="utf-8"),
+        type=_input_file,
         help="TOML file to be verified (`stdin` by default)",
     ),
+    "recursive": dict(
+        flags=("-r", "--recursive"),
+        action="append",
+        type=_directory,
+        default=[],
+        metavar="DIR",
+        help="Validate all the `pyproject.toml` files found in DIR and its "
+        "subdirectories (hidden directories, e.g. `.git`, and virtual environments "
+        "are skipped)",
+    ),
     "enable": dict(
         flags=("-E", "--enable-plugins"),
         nargs="+",
@@ -102,6 +151,40 @@ META: dict[str, dict] = {
         action="store_true",
         help="Print the JSON equivalent to the given TOML",
     ),
+    "all_errors": dict(
+        flags=("--all-errors",),
+        action="store_true",
+        help="Report all the errors found in each file (instead of stopping at the "
+        "first one)",
+    ),
+    "daemon": dict(
+        flags=("--daemon",),
+        action="store_true",
+        help="Forward the validation to a server started with "
+        "`validate-pyproject serve` (if not running, the files are validated locally)",
+    ),
+    "no_cache": dict(
+        flags=("--no-cache",),
+        action="store_true",
+        help="Do not skip files previously validated with the same contents "
+        "(cached in `VALIDATE_PYPROJECT_CACHE_DIR`, when set)",
+    ),
+    "profile": dict(
+        flags=("--profile",),
+        dest="profile",
+        action="store_const",
+        const="table",
+        help="Print a table with the time spent in each phase of the validation "
+        "(e.g. plugin discovery, compilation, TOML parsing) to `stderr`. "
+        "Files are validated sequentially in the current process",
+    ),
+    "profile_json": dict(
+        flags=("--profile-json",),
+        dest="profile",
+        action="store_const",
+        const="json",
+        help="Same as `--profile`, but printing JSON",
+    ),
     "tool": dict(
         flags=("-t", "--tool"),
         action="append",
@@ -113,23 +196,36 @@ META: dict[str, dict] = {
         help="Load a pyproject.json file and read all the $ref's into tools "
         "(see https://json.schemastore.org/pyproject.json)",
     ),
+    "jobs": dict(
+        flags=("-j", "--jobs"),
+        type=_jobs,
+        default=1,
+        help="Number of processes used to validate multiple files "
+        "(default: 1, use 0 for the number of CPUs)",
+    ),
 }
 
 
 class CliParams(NamedTuple):
-    input_file: list[io.TextIOBase]
+    input_file: list[Path | io.TextIOBase]
     plugins: list[PluginWrapper]
     tool: list[str]
     store: str
     loglevel: int = logging.WARNING
     dump_json: bool = False
+    all_errors: bool = False
+    no_cache: bool = False
+    daemon: bool = False
+    profile: str | None = None
+    jobs: int = 1
+    recursive: Sequence[Path] = ()
 
 
 def __meta__(plugins: Sequence[PluginProtocol]) -> dict[str, dict]:
     """'Hyper parameters' to instruct :mod:`argparse` how to create the CLI"""
     meta = {k: v.copy() for k, v in META.items()}
     meta["enable"]["choices"] = {p.tool for p in plugins}
-    meta["input_file"]["default"] = [_STDIN]  # lazily defined to facilitate testing
+    meta["input_file"]["default"] = []  # `stdin` if no file or directory is given
     return meta
 
 
@@ -184,6 +280,39 @@ def select_plugins(
     return available
 
 
+def select_entry_points(
+    enabled: Sequence[str] = (),
+    disabled: Sequence[str] = (),
+) -> Callable[[EntryPoint], bool]:
+    """Equivalent to :obj:`select_plugins`, but working as a ``filtering`` function
+    for :obj:`~validate_pyproject.plugins.list_from_entry_points`, i.e. it can be used
+    to avoid loading plugins that would be discarded anyway.
+
+    Entry points in the ``validate_pyproject.tool_schema`` group are named after the
+    ``tool`` they define. The tools defined by ``validate_pyproject.multi_schema``
+    entry points are only known after they are loaded (and they may override the
+    ``tool_schema`` plugins with a higher ``priority``), so these are always loaded.
+    """
+
+    def _filter(entry_point: EntryPoint) -> bool:
+        if entry_point.group != _TOOL_GROUP:
+            return True
+        if enabled and entry_point.name not in enabled:
+            return False
+        return entry_point.name not in disabled
+
+    return _filter
+
+
+def load_plugins(args: Sequence[str]) -> list[PluginWrapper | StoredPlugin]:
+    """Load the plugins registered via entry points, skipping the ones that would be
+    excluded by the ``--enable-plugins`` or ``--disable-plugins`` options in ``args``.
+    """
+    selection = _pre_parse(args, "enable", "disable")
+    filtering = select_entry_points(selection.enable, selection.disable)
+    return list_plugins_from_entry_points(filtering)
+
+
 def setup_logging(loglevel: int) -> None:
     """Setup basic logging
 
@@ -222,37 +351,321 @@ def run(args: Sequence[str] = ()) -> int:
       args (List[str]): command line parameters as list of strings
           (for example  ``["--verbose", "setup.cfg"]``).
     """
-    args = args or sys.argv[1:]
-    plugins = list_plugins_from_entry_points()
-    params: CliParams = parse_args(args, plugins)
-    setup_logging(params.loglevel)
-    tool_plugins = [RemotePlugin.from_str(t) for t in params.tool]
-    if params.store:
-        tool_plugins.extend(load_store(params.store))
-    validator = Validator(params.plugins, extra_plugins=tool_plugins)
+    args = list(args or sys.argv[1:])
+    if args[:1] == ["serve"]:
+        from . import daemon
 
-    exceptions = _ExceptionGroup()
-    for file in params.input_file:
+        return daemon.run(args[1:])
+
+    output = _pre_parse(args, "profile", "profile_json").profile
+    with profiling.profile() if output else nullcontext() as prof:
         try:
-            _run_on_file(validator, params, file)
-        except _REGULAR_EXCEPTIONS as ex:  # noqa: PERF203
-            exceptions.add(f"Invalid {_format_file(file)}", ex)
+            return _run(args, local=bool(prof))
+        finally:
+            if prof:
+                report = prof.format_json() if output == "json" else prof.format_table()
+                print(report, file=sys.stderr)
+
+
+def _run(args: Sequence[str], *, local: bool = False) -> int:
+    results: Iterable[_Report] | None = None if local else _forward_to_daemon(args)
+    if results is None:
+        plugins = load_plugins(args)
+        params: CliParams = parse_args(args, plugins)
+        setup_logging(params.loglevel)
+        if params.profile:  # phases are only recorded in the current process
+            params = params._replace(jobs=1)
+        results = validate_files(params, load_tools(params))
+
+    exceptions = _ExceptionGroup()
+    for file, output, ex in results:
+        if ex:
+            exceptions.add(f"Invalid {file}", ex)
+        else:
+            print(output)
 
     exceptions.raise_if_any()
 
     return 0
 
 
-def _run_on_file(validator: Validator, params: CliParams, file: io.TextIOBase) -> None:
+def load_tools(params: CliParams) -> list[PluginProtocol]:
+    """Load the schemas for the external tools given via ``--tool`` and ``--store``"""
+    tool_plugins: list[PluginProtocol] = [RemotePlugin.from_str(t) for t in params.tool]
+    if params.store:
+        tool_plugins.extend(load_store(params.store))
+    return tool_plugins
+
+
+def validate_files(
+    params: CliParams, tool_plugins: Sequence[PluginProtocol]
+) -> Iterator[_Report]:
+    """Validate the files selected via command line, yielding (in order) their
+    description, the output to be printed and the error found (if any).
+    """
+    # External tools (e.g. ``--store``) can add dozens of schemas, but only a few
+    # ``[tool.*]`` tables are usually present in a file: compile them on demand
+    lazy = bool(tool_plugins)
+
+    files: Iterable[Path | io.TextIOBase] = params.input_file
+    max_jobs = params.jobs or os.cpu_count() or 1
+    jobs = min(max_jobs, len(params.input_file))
+    if params.recursive:
+        # Discovered files are validated while the directories are still being walked
+        found = chain.from_iterable(map(find_pyproject_files, params.recursive))
+        files, jobs = chain(params.input_file, found), max_jobs
+    elif not params.input_file:
+        files = [cast("io.TextIOBase", _STDIN)]  # lazily defined to facilitate testing
+
+    if jobs > 1:
+        options = _WorkerOptions(
+            params.loglevel,
+            params.dump_json,
+            params.all_errors,
+            params.no_cache,
+            params.plugins,
+            tool_plugins,
+            lazy,
+        )
+        results = _run_parallel(jobs, options, files)
+    else:
+        # The validator is only needed here (each process gets its own)
+        validator = get_validator(
+            params.plugins, extra_plugins=tool_plugins, lazy_tools=lazy
+        )
+        cache = _ResultCache.create(validator, enabled=not params.no_cache)
+        results = ((f, *_run_on_file(validator, params, f, cache)) for f in files)
+
+    for file, output, ex in results:
+        yield _format_file(file), output, ex
+
+
+def _pre_parse(args: Sequence[str], *keys: str) -> argparse.Namespace:
+    """Parse a few options, before the plugins are loaded.
+    The defaults are used for invalid arguments (the main parser reports the error).
+    """
+    parser = _PreParser(add_help=False)
+    for key in keys:
+        opts = META[key].copy()
+        parser.add_argument(*opts.pop("flags", ()), **opts)
+    try:
+        known, _ = parser.parse_known_args(args)
+    except argparse.ArgumentError:
+        known, _ = parser.parse_known_args([])
+    return known
+
+
+class _PreParser(argparse.ArgumentParser):
+    def error(self, message: str) -> NoReturn:
+        raise argparse.ArgumentError(None, message)
+
+
+def _forward_to_daemon(args: Sequence[str]) -> list[_Report] | None:
+    options = _pre_parse(args, "daemon", "verbose", "very_verbose")
+    if not options.daemon:
+        return None
+
+    # The errors reported by the server are logged as the ones found locally
+    setup_logging(options.loglevel or logging.WARNING)
+    from . import daemon
+
+    return daemon.forward(args)
+
+
+_Result = tuple[str, Optional[Exception]]
+_Report = tuple[str, str, Optional[Exception]]  # file description + result
+
+
+def _run_on_file(
+    validator: Validator,
+    params: CliParams,
+    file: Path | io.TextIOBase,
+    cache: _ResultCache | None = None,
+) -> _Result:
     if file in (sys.stdin, _STDIN):
         print("Expecting input via `stdin`...", file=sys.stderr, flush=True)
 
-    toml_equivalent = tomllib.loads(file.read())
-    validator(toml_equivalent)
-    if params.dump_json:
-        print(json.dumps(toml_equivalent, indent=2))
-    else:
-        print(f"Valid {_format_file(file)}")
+    return _validate(
+        validator,
+        file,
+        dump_json=params.dump_json,
+        all_errors=params.all_errors,
+        cache=cache,
+    )
+
+
+def _validate(
+    validator: Validator,
+    file: Path | io.TextIOBase,
+    *,
+    dump_json: bool = False,
+    all_errors: bool = False,
+    cache: _ResultCache | None = None,
+) -> _Result:
+    try:
+        contents = file.read_bytes() if isinstance(file, Path) else file.read().encode()
+        if cache and not dump_json and contents in cache:
+            return f"Valid {_format_file(file)}", None
+        with profiling.phase("parse"):
+            toml_equivalent = tomllib.loads(contents.decode())
+        validator(toml_equivalent, collect="all" if all_errors else "first")
+    except (*_REGULAR_EXCEPTIONS, OSError, UnicodeDecodeError) as ex:
+        return "", ex
+    if cache:
+        cache.add(contents)
+    if dump_json:
+        return json.dumps(toml_equivalent, indent=2), None
+    return f"Valid {_format_file(file)}", None
+
+
+class _ResultCache:
+    """Record of the file contents known to be valid (stored in
+    ``VALIDATE_PYPROJECT_CACHE_DIR``), so that unchanged files can be skipped.
+    Invalid files are not recorded (they are validated again to report the errors).
+    """
+
+    def __init__(self, validator: Validator, directory: Path):
+        self.directory = directory
+        # Results are only reused with the same schemas, formats, extra validations
+        # and version of this package (and of the libraries used by the formats)
+        self._salt = hashlib.sha256(f"{__version__}\0{validator.fingerprint}".encode())
+        for fn in validator.extra_validations:
+            name = getattr(fn, "__qualname__", repr(fn))
+            self._salt.update(f"\0{fn.__module__}.{name}".encode())
+        for dependency in _format_dependencies():
+            self._salt.update(f"\0{dependency}".encode())
+
+    @classmethod
+    def create(cls, validator: Validator, *, enabled: bool) -> _ResultCache | None:
+        directory = caching.local_dir("results") if enabled else None
+        return cls(validator, directory) if directory else None
+
+    def _path(self, contents: bytes) -> Path:
+        digest = self._salt.copy()
+        digest.update(contents)
+        key = digest.hexdigest()
+        return self.directory / key[:2] / key[2:]
+
+    def __contains__(self, contents: bytes) -> bool:
+        return self._path(contents).exists()
+
+    def add(self, contents: bytes) -> None:
+        try:
+            caching.write_atomic(self._path(contents), "")
+        except OSError as ex:  # pragma: no cover
+            _logger.debug(f"Cannot cache validation result: {ex}")
+
+
+def _format_dependencies() -> Iterator[str]:
+    """Versions of the distributions used by the format functions and stamp of the
+    classifiers downloaded from PyPI (if any), as they can change the validation
+    results without changing the schemas.
+    The classifiers are not loaded (or downloaded) just to compute the stamp.
+    """
+    for dist in _FORMAT_DISTRIBUTIONS:
+        try:
+            yield f"{dist}=={metadata.version(dist)}"
+        except metadata.PackageNotFoundError:  # noqa: PERF203
+            yield f"{dist} (not installed)"
+    yield f"classifiers: {formats._classifiers_stamp()}"
+
+
+class _WorkerOptions(NamedTuple):
+    loglevel: int
+    dump_json: bool
+    all_errors: bool
+    no_cache: bool
+    plugins: Sequence[PluginProtocol]
+    extra_plugins: Sequence[PluginProtocol]
+    lazy_tools: bool
+
+
+def _run_parallel(
+    jobs: int, options: _WorkerOptions, files: Iterable[Path | io.TextIOBase]
+) -> Iterator[tuple[Path | io.TextIOBase, str, Exception | None]]:
+    """Validate ``files`` in a pool of processes, yielding the results in order.
+    Only a limited number of files is submitted ahead of the results being consumed,
+    so ``files`` can be lazily produced (e.g. while walking a directory tree).
+    """
+    executor = ProcessPoolExecutor(jobs, initializer=_Worker.setup, initargs=(options,))
+    pending: deque[tuple[Path | io.TextIOBase, Future[_Result]]] = deque()
+
+    def _next_result() -> tuple[Path | io.TextIOBase, str, Exception | None]:
+        file, future = pending.popleft()
+        return (file, *future.result())
+
+    with executor:
+        for file in files:
+            # Streams cannot be shared with other processes, paths are read by workers
+            task = file if isinstance(file, Path) else io.StringIO(file.read())
+            pending.append((file, executor.submit(_Worker.run, task)))
+            if len(pending) >= jobs * _IN_FLIGHT_PER_JOB:
+                yield _next_result()
+        while pending:
+            yield _next_result()
+
+
+def find_pyproject_files(directory: Path) -> Iterator[Path]:
+    """Find the ``pyproject.toml`` files in ``directory`` and its subdirectories
+    (in a deterministic order, skipping hidden directories, virtual environments and
+    caches).
+    """
+    stack = [os.fspath(directory)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError as ex:
+            _logger.warning(f"Cannot list directory: {ex}")
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.name == "pyproject.toml" and entry.is_file():
+                yield Path(entry.path)
+            elif entry.is_dir(follow_symlinks=False) and not _skip_dir(entry):
+                subdirs.append(entry.path)
+        stack.extend(reversed(subdirs))
+
+
+def _skip_dir(entry: os.DirEntry) -> bool:
+    return (
+        entry.name.startswith(".")
+        or entry.name in _SKIP_DIRS
+        or os.path.exists(os.path.join(entry.path, "pyvenv.cfg"))
+    )
+
+
+class _Worker:
+    """State for the processes spawned when ``--jobs`` is given:
+    the validator is compiled only once per process.
+    """
+
+    validator: Validator
+    dump_json = False
+    all_errors = False
+    cache: _ResultCache | None = None
+
+    @classmethod
+    def setup(cls, options: _WorkerOptions) -> None:
+        setup_logging(options.loglevel)
+        cls.dump_json = options.dump_json
+        cls.all_errors = options.all_errors
+        cls.validator = get_validator(
+            options.plugins,
+            extra_plugins=options.extra_plugins,
+            lazy_tools=options.lazy_tools,
+        )
+        cls.cache = _ResultCache.create(cls.validator, enabled=not options.no_cache)
+
+    @classmethod
+    def run(cls, file: Path | io.TextIOBase) -> _Result:
+        return _validate(
+            cls.validator,
+            file,
+            dump_json=cls.dump_json,
+            all_errors=cls.all_errors,
+            cache=cls.cache,
+        )
 
 
 main = exceptions2exit()(run)
@@ -283,7 +696,9 @@ def _format_plugin_help(plugin: PluginProtocol) -> str:
     return f"* {plugin.tool!r}{help_text}"
 
 
-def _format_file(file: io.TextIOBase) -> str:
+def _format_file(file: Path | io.TextIOBase) -> str:
+    if isinstance(file, Path):
+        return f"file: {file}"
     if hasattr(file, "name") and file.name:
         return f"file: {file.name}"
     return "file"  # pragma: no cover
@@ -0,0 +1,335 @@
+"""Long-running validation server (``validate-pyproject serve``) that keeps warm
+validators between invocations (e.g. for editors and ``pre-commit`` hooks) and the
+client used by ``validate-pyproject --daemon``.
+
+The server listens on a Unix domain socket inside a private directory (only
+accessible by the current user) and only answers to processes of the same user.
+Each connection carries a single request and a single response, encoded as JSON
+objects terminated by a newline:
+
+- request: ``{"args": [<command line arguments>], "cwd": <working directory>}``
+- response: ``{"results": [[<file>, <output>, <error message or null>], ...]}``
+  or ``{"fallback": <reason>}`` when the client should validate the files itself
+  (e.g. for ``stdin`` or invalid arguments).
+
+The server exits after a period of inactivity, and restarts itself when the
+installed packages change (so new or updated plugins are loaded).
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import logging
+import os
+import socket
+import stat
+import struct
+import sys
+import tempfile
+from contextlib import contextmanager, redirect_stderr, redirect_stdout, suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from . import cli
+from .errors import ValidationError
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Sequence
+
+    from .plugins import PluginProtocol
+
+assert __spec__ is not None
+assert __spec__.parent is not None
+
+_PARENT = __spec__.parent
+_logger = logging.getLogger(__name__)
+
+SOCKET_ENV = "VALIDATE_PYPROJECT_SOCKET"
+DEFAULT_IDLE_TIMEOUT = 15 * 60  # seconds
+_CONNECT_TIMEOUT = 1  # seconds
+_IO_TIMEOUT = 30  # seconds (server side, for reading requests)
+_MAX_REQUEST = 16 * 1024 * 1024  # bytes
+
+
+class ReportedError(ValidationError):
+    """Error found by the validation server (only the message is transmitted)"""
+
+
+def socket_path() -> Path | None:
+    """Location of the server socket: ``VALIDATE_PYPROJECT_SOCKET`` or a file in a
+    private per-user directory (inside ``XDG_RUNTIME_DIR`` or the temporary dir).
+    ``None`` when Unix domain sockets are not supported (e.g. on Windows).
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = os.getenv(SOCKET_ENV)
+    if path:
+        return Path(path)
+    if not hasattr(os, "getuid"):
+        return None
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(runtime_dir, f"validate-pyproject-{os.getuid()}", "daemon.sock")
+
+
+# ---- Server ----
+
+
+class Server:
+    def __init__(self, path: Path, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.path = path
+        self.idle_timeout = idle_timeout
+        self._stamps = _environment_stamps()
+        # Plugins are loaded once per configuration, validators are shared via
+        # `api.get_validator`
+        self._plugins: dict[tuple, list] = {}
+        self._tools: dict[tuple, list[PluginProtocol]] = {}
+
+    def serve_forever(self) -> bool:
+        """Answer requests until the server is idle for ``idle_timeout`` seconds
+        (returns ``False``) or the installed packages change (returns ``True``,
+        i.e. the server should be restarted).
+        """
+        _ensure_private_dir(self.path.parent, create=True)
+        if _is_alive(self.path):
+            msg = f"Server already listening on {self.path}"
+            raise RuntimeError(msg)
+        with suppress(FileNotFoundError):
+            self.path.unlink()  # stale socket
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            umask = os.umask(0o177)
+            try:
+                sock.bind(os.fspath(self.path))
+            finally:
+                os.umask(umask)
+            sock.listen()
+            sock.settimeout(self.idle_timeout)
+            _logger.info(f"Listening on {self.path}")
+            try:
+                return self._loop(sock)
+            finally:
+                with suppress(OSError):
+                    self.path.unlink()
+
+    def _loop(self, sock: socket.socket) -> bool:
+        while True:
+            try:
+                conn, _ = sock.accept()
+            except socket.timeout:
+                _logger.info("Idle timeout reached, exiting")
+                return False
+            with conn:
+                if _environment_stamps() != self._stamps:
+                    # The client will validate locally while the server restarts
+                    _logger.info("Installed packages changed, restarting")
+                    return True
+                conn.settimeout(_IO_TIMEOUT)
+                self._handle(conn)
+
+    def _handle(self, conn: socket.socket) -> None:
+        uid = _peer_uid(conn)
+        if uid is not None and uid != os.getuid():
+            _logger.warning(f"Connection from user {uid} rejected")
+            return
+
+        with conn.makefile("rwb") as stream:
+            request = stream.readline(_MAX_REQUEST)
+            if not request:
+                return  # e.g. checking if the server is alive
+            try:
+                response = self.process(json.loads(request))
+            except (Exception, SystemExit) as ex:
+                _logger.debug("Cannot process request", exc_info=True)
+                response = {"fallback": f"{ex.__class__.__name__}: {ex}"}
+            try:
+                stream.write(json.dumps(response).encode() + b"\n")
+                stream.flush()
+            except OSError as ex:  # pragma: no cover
+                _logger.debug(f"Cannot send response: {ex}")
+
+    def process(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Validate the files given in ``request`` (see module docstring)"""
+        args: list[str] = request["args"]
+        with _working_dir(request["cwd"]), redirect_stdout(io.StringIO()):
+            with redirect_stderr(io.StringIO()):  # e.g. ``--help`` or invalid args
+                plugins = self._load_plugins(args)
+                params: cli.CliParams = cli.parse_args(args, plugins)
+            files = params.input_file
+            if not (files or params.recursive) or not all(
+                isinstance(f, Path) for f in files
+            ):
+                return {"fallback": "stdin"}
+
+            tools = self._load_tools(params)
+            # Validators are already warm, avoid spawning processes for each request
+            params = params._replace(jobs=1)
+            with _log_level(params.loglevel):
+                results = [
+                    [file, output, ex and _message(ex)]
+                    for file, output, ex in cli.validate_files(params, tools)
+                ]
+        return {"results": results}
+
+    def _load_plugins(self, args: Sequence[str]) -> list:
+        selection = cli._pre_parse(args, "enable", "disable")
+        key = (tuple(selection.enable), tuple(selection.disable))
+        if key not in self._plugins:
+            self._plugins[key] = cli.load_plugins(args)
+        return self._plugins[key]
+
+    def _load_tools(self, params: cli.CliParams) -> list[PluginProtocol]:
+        key = (tuple(params.tool), params.store)
+        if key not in self._tools:
+            self._tools[key] = cli.load_tools(params)
+        return self._tools[key]
+
+
+def _ensure_private_dir(path: Path, *, create: bool = False) -> None:
+    if create:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    info = path.lstat()
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or info.st_mode & 0o077
+    ):
+        msg = f"{path} must be a directory only accessible by the current user"
+        raise PermissionError(msg)
+
+
+def _peer_uid(conn: socket.socket) -> int | None:
+    if not hasattr(socket, "SO_PEERCRED"):  # pragma: no cover
+        return None  # rely on the permissions of the directory
+    fmt = "3i"  # pid, uid, gid
+    creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize(fmt))
+    uid: int = struct.unpack(fmt, creds)[1]
+    return uid
+
+
+def _is_alive(path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(os.fspath(path))
+        except OSError:
+            return False
+    return True
+
+
+def _environment_stamps() -> list[int | None]:
+    # Installing/removing distributions modifies the entries in ``sys.path``
+    return [_mtime(os.path.abspath(p)) for p in sys.path]
+
+
+def _mtime(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@contextmanager
+def _working_dir(path: str) -> Generator[None, None, None]:
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+@contextmanager
+def _log_level(level: int) -> Generator[None, None, None]:
+    # The error messages depend on the logging level (see ``error_reporting``)
+    logger = logging.getLogger(_PARENT)
+    previous = logger.level
+    logger.setLevel(level)
+    try:
+        yield
+    finally:
+        logger.setLevel(previous)
+
+
+def _message(ex: Exception) -> str:
+    if isinstance(ex, cli._REGULAR_EXCEPTIONS):
+        return str(ex)
+    return f"{ex.__class__.__name__}: {ex}"
+
+
+# ---- Client ----
+
+
+def forward(
+    args: Sequence[str], path: Path | None = None
+) -> list[tuple[str, str, Exception | None]] | None:
+    """Ask the server to validate the files given in the command line ``args``.
+    Returns ``None`` if the server is not available or cannot handle the request
+    (the files should be validated locally).
+    """
+    path = path or socket_path()
+    if path is None:
+        _logger.debug("Validation server not supported on this platform")
+        return None
+    request = {"args": list(args), "cwd": os.getcwd()}
+    try:
+        _ensure_private_dir(path.parent)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(_CONNECT_TIMEOUT)
+            sock.connect(os.fspath(path))
+            sock.settimeout(None)
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as stream:
+                response = json.loads(stream.readline() or "{}")
+    except (OSError, ValueError, AttributeError) as ex:  # AttributeError: no AF_UNIX
+        _logger.debug(f"Validation server not available ({ex})")
+        return None
+
+    if "results" not in response:
+        reason = response.get("fallback", "restarting")
+        _logger.debug(f"Validation server cannot handle the request ({reason})")
+        return None
+    return [
+        (file, output, ReportedError(error) if error else None)
+        for file, output, error in response["results"]
+    ]
+
+
+# ---- CLI ----
+
+
+def run(args: Sequence[str] = ()) -> int:
+    """Start the validation server (``validate-pyproject serve``)"""
+    parser = argparse.ArgumentParser(
+        prog="validate-pyproject serve",
+        description="Keep validators in memory to quickly answer requests from "
+        "`validate-pyproject --daemon`",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        help=f"Path to the Unix socket (default: ${SOCKET_ENV} or a file in a private "
+        "directory inside $XDG_RUNTIME_DIR or the temporary directory)",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help="Exit after the given number of seconds without requests "
+        "(default: %(default)s)",
+    )
+    for key in ("verbose", "very_verbose"):
+        opts = cli.META[key].copy()
+        parser.add_argument(*opts.pop("flags", ()), **opts)
+    parser.set_defaults(loglevel=logging.WARNING)
+    params = parser.parse_args(args)
+    cli.setup_logging(params.loglevel)
+
+    path = params.socket or socket_path()
+    if path is None:
+        parser.error("Unix domain sockets are not supported on this platform")
+    server = Server(path, params.idle_timeout)
+    if server.serve_forever():
+        cmd = [sys.executable, "-m", _PARENT, "serve", *args]
+        os.execv(sys.executable, cmd)  # noqa: S606
+    return 0
@@ -8,10 +8,12 @@ import re
 import typing
 from contextlib import contextmanager
 from textwrap import indent, wrap
-from typing import Any
+from typing import Any, Callable
 
 from fastjsonschema import JsonSchemaValueException
 
+from . import formats
+
 if typing.TYPE_CHECKING:
     import sys
     from collections.abc import Generator, Iterator, Sequence
@@ -47,6 +49,11 @@ _TOML_JARGON = {
     "property names": "keys",
 }
 
+# Functions returning valid values similar to the one that failed a ``format`` check
+_FORMAT_SUGGESTIONS: dict[str, Callable[[str], list[str]]] = {
+    "trove-classifier": formats._suggest_classifiers,
+}
+
 _FORMATS_HELP = """
 For more details about `format` see
 https://validate-pyproject.readthedocs.io/en/latest/api/validate_pyproject.formats.html
@@ -68,24 +75,70 @@ class ValidationError(JsonSchemaValueException):
     Depending on the level of the verbosity of the ``logging`` configuration
     the exception message will be only ``summary`` (default) or a combination of
     ``summary`` and ``details`` (when the logging level is set to :obj:`logging.DEBUG`).
+
+    The message, ``summary`` and ``details`` are only computed when first accessed
+    (e.g. when the exception is displayed), but the verbosity is the one configured
+    when the exception was created.
     """
 
-    summary = ""
-    details = ""
     _original_message = ""
+    _formatter: _ErrorFormatting | None = None  # pending (lazy) formatting
+    _message: str | None = None
+    _summary = ""
+    _details = ""
 
     @classmethod
     def _from_jsonschema(cls, ex: JsonSchemaValueException) -> Self:
         formatter = _ErrorFormatting(ex)
-        obj = cls(str(formatter), ex.value, formatter.name, ex.definition, ex.rule)
+        obj = cls(ex.message, ex.value, formatter.name, ex.definition, ex.rule)
         debug_code = os.getenv("JSONSCHEMA_DEBUG_CODE_GENERATION", "false").lower()
         if debug_code != "false":  # pragma: no cover
             obj.__cause__, obj.__traceback__ = ex.__cause__, ex.__traceback__
         obj._original_message = ex.message
-        obj.summary = formatter.summary
-        obj.details = formatter.details
+        obj._formatter = formatter
+        obj._message = None
         return obj
 
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            self._message = str(self._formatter)
+            self.args = (self._message,)
+        return self._message
+
+    @message.setter
+    def message(self, value: str) -> None:
+        self._message = value
+
+    @property
+    def summary(self) -> str:
+        if not self._summary and self._formatter:
+            self._summary = self._formatter.summary
+        return self._summary
+
+    @summary.setter
+    def summary(self, value: str) -> None:
+        self._summary = value
+
+    @property
+    def details(self) -> str:
+        if not self._details and self._formatter:
+            self._details = self._formatter.details
+        return self._details
+
+    @details.setter
+    def details(self, value: str) -> None:
+        self._details = value
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Send the formatted strings instead of the pending formatting
+        state = {**self.__dict__, "_formatter": None, "_message": self.message}
+        state.update(_summary=self.summary, _details=self.details)
+        return (self.__class__, (self.message,), state)
+
 
 @contextmanager
 def detailed_errors() -> Generator[None, None, None]:
@@ -102,9 +155,10 @@ class _ErrorFormatting:
         self._original_message: str = self.ex.message.replace(ex.name, self.name)
         self._summary = ""
         self._details = ""
+        self._verbose = _logger.getEffectiveLevel() <= logging.DEBUG
 
     def __str__(self) -> str:
-        if _logger.getEffectiveLevel() <= logging.DEBUG and self.details:
+        if self._verbose and self.details:
             return f"{self.summary}\n\n{self.details}"
 
         return self.summary
@@ -142,6 +196,12 @@ class _ErrorFormatting:
             summary = _SummaryWriter(_TOML_JARGON)
             return f"{msg}:\n\n{indent(summary(schema), '    ')}"
 
+        suggest = _FORMAT_SUGGESTIONS.get(schema) if self.ex.rule == "format" else None
+        if suggest and isinstance(self.ex.value, str):
+            suggestions = "\n".join(f"    - {s!r}" for s in suggest(self.ex.value))
+            if suggestions:
+                return f"{msg}\n\nDid you mean:\n{suggestions}"
+
         return msg
 
     def _expand_details(self) -> str:
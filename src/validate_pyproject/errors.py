@@ -10,7 +10,10 @@ Note that ``validate-pyproject`` derives most of its exceptions from
 )
 """
 
-from textwrap import dedent
+from __future__ import annotations
+
+import typing
+from textwrap import dedent, indent
 
 from fastjsonschema import (
     JsonSchemaDefinitionException as _JsonSchemaDefinitionException,
@@ -18,6 +21,9 @@ from fastjsonschema import (
 
 from .error_reporting import ValidationError
 
+if typing.TYPE_CHECKING:
+    from collections.abc import Sequence
+
 
 class URLMissingTool(RuntimeError):
     _DESC = """\
@@ -73,9 +79,35 @@ class SchemaWithDuplicatedId(_JsonSchemaDefinitionException):
         super().__init__(msg.format(schema_id=schema_id))
 
 
+class ValidationErrors(ValidationError):
+    """All the violations found in a single document when the validation is performed
+    with ``collect="all"`` (see :meth:`validate_pyproject.api.Validator.__call__`).
+    The individual exceptions are available via the ``errors`` attribute.
+    """
+
+    def __init__(self, errors: Sequence[ValidationError], value: object = None):
+        self.errors = list(errors)
+        number = len(self.errors)
+        header = f"{number} validation error{'s' if number != 1 else ''} found:"
+        msg = "\n\n".join([header, *(_bullet(str(ex)) for ex in self.errors)])
+        super().__init__(msg, value, "data", {}, "")
+        self.summary = "\n".join(
+            _bullet(ex.summary or ex.message) for ex in self.errors
+        )
+        self.details = "\n\n".join(ex.details for ex in self.errors if ex.details)
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        return (self.__class__, (self.errors, self.value))
+
+
+def _bullet(text: str) -> str:
+    return "- " + indent(text, "  ")[2:]
+
+
 __all__ = [
     "InvalidSchemaVersion",
     "SchemaMissingId",
     "SchemaWithDuplicatedId",
     "ValidationError",
+    "ValidationErrors",
 ]
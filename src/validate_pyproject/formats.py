@@ -9,6 +9,8 @@ function with a ``-`` to obtain the format name and vice versa.
 
 from __future__ import annotations
 
+import functools
+import itertools
 import keyword
 import logging
 import os
@@ -16,8 +18,11 @@ import re
 import string
 import typing
 
+from . import caching
+
 if typing.TYPE_CHECKING:
     import builtins
+    from collections.abc import Iterable, Iterator, Mapping
     from typing import Literal
 
 _logger = logging.getLogger(__name__)
@@ -61,11 +66,94 @@ VERSION_REGEX = re.compile(
 )
 
 
+# Non-ASCII characters matched by ``[a-z]`` in ``VERSION_REGEX`` (``re.IGNORECASE``)
+_PEP440_CASEFOLD = str.maketrans(
+    {"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"}
+)
+# Labels indexed by their first letter (the longest first, when one is a prefix)
+_PEP440_PRE = {
+    "a": ("alpha", "a"),
+    "b": ("beta", "b"),
+    "c": ("c",),
+    "p": ("preview", "pre"),
+    "r": ("rc",),
+}
+_PEP440_POST = {"p": ("post",), "r": ("rev", "r")}
+_PEP440_DEV = {"d": ("dev",)}
+_PEP440_SEPARATORS = frozenset("-_.")
+_DIGITS = "0123456789"
+
+
 def pep440(version: str) -> bool:
     """See :ref:`PyPA's version specification <pypa:version-specifiers>`
     (initially introduced in :pep:`440`).
+
+    Single-pass equivalent to matching ``VERSION_REGEX`` (kept as the reference
+    implementation), faster for the most common versions (e.g. ``1.2.3``).
+    """
+    value = version.strip()
+    if not value.isascii():
+        value = value.translate(_PEP440_CASEFOLD)
+        if not value.isascii():
+            return False
+    value = value.lower()
+    rest = value[1:] if value[:1] == "v" else value
+
+    # Fast path: release segments only
+    if (
+        rest.replace(".", "").isdigit()
+        and rest[0] != "."
+        and rest[-1] != "."
+        and ".." not in rest
+    ):
+        return True
+
+    tail = _pep440_release(rest)
+    if tail is None:
+        return False
+    tail = _pep440_suffix(tail, _PEP440_PRE)
+    if tail[:1] == "-" and tail[1:2].isdigit():
+        tail = tail[1:].lstrip(_DIGITS)
+    else:
+        tail = _pep440_suffix(tail, _PEP440_POST)
+    tail = _pep440_suffix(tail, _PEP440_DEV)
+
+    if tail[:1] == "+":  # local version
+        segments = tail[1:].replace("-", ".").replace("_", ".").split(".")
+        return all(segment.isalnum() for segment in segments)
+    return not tail
+
+
+def _pep440_release(value: str) -> str | None:
+    """Remove the epoch and release segments from the start of ``value``
+    (or return ``None`` if they are missing).
     """
-    return VERSION_REGEX.match(version) is not None
+    tail = value.lstrip(_DIGITS)
+    if tail == value:
+        return None
+    if tail[:1] == "!":  # epoch
+        value = tail[1:]
+        tail = value.lstrip(_DIGITS)
+        if tail == value:
+            return None
+    while tail[:1] == ".":
+        rest = tail[1:].lstrip(_DIGITS)
+        if len(rest) == len(tail) - 1:
+            break
+        tail = rest
+    return tail
+
+
+def _pep440_suffix(value: str, labels: Mapping[str, tuple[str, ...]]) -> str:
+    """Remove ``[-_.]?<label>[-_.]?[0-9]*`` from the start of ``value`` (if present)"""
+    rest = value[1:] if value[:1] in _PEP440_SEPARATORS else value
+    for label in labels.get(rest[:1], ()):
+        if rest.startswith(label):
+            rest = rest[len(label) :]
+            if rest[:1] in _PEP440_SEPARATORS:
+                rest = rest[1:]
+            return rest.lstrip(_DIGITS)
+    return value
 
 
 # -------------------------------------------------------------------------------------
@@ -82,6 +170,41 @@ def pep508_identifier(name: str) -> bool:
     return PEP508_IDENTIFIER_REGEX.match(name) is not None
 
 
+# Conservative subset of the grammar (names, extras and version specifiers), covering
+# most of the dependencies in the wild. Anything else (e.g. markers, URLs, local or
+# arbitrary versions, parenthesised specifiers) is checked with ``packaging``.
+_PEP508_NAME = r"[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?"
+_PEP508_RELEASE = r"[0-9]+(?:\.[0-9]+)*"
+_PEP508_SUFFIX = r"(?:(?:a|b|rc)[0-9]+)?(?:\.post[0-9]+)?(?:\.dev[0-9]+)?"
+_PEP508_SPEC = (
+    r"(?:"
+    rf"(?:==|!=) *{_PEP508_RELEASE}\.\*"  # prefix matching
+    rf"|~= *[0-9]+(?:\.[0-9]+)+{_PEP508_SUFFIX}"  # at least 2 release segments
+    rf"|(?:==|!=|<=|>=|<|>) *{_PEP508_RELEASE}{_PEP508_SUFFIX}"
+    r")"
+)
+PEP508_SIMPLE_REGEX = re.compile(
+    rf"{_PEP508_NAME}"
+    rf"(?: *\[ *{_PEP508_NAME}(?: *, *{_PEP508_NAME})* *\])?"
+    rf"(?: *{_PEP508_SPEC}(?: *, *{_PEP508_SPEC})*)?"
+)
+
+
+def _int_from_env(env_var: str, default: builtins.int) -> builtins.int:
+    import builtins  # ``int`` is shadowed by a format function in this module
+
+    try:
+        return max(builtins.int(os.getenv(env_var) or default), 0)
+    except ValueError:
+        _logger.warning(f"Invalid value for `{env_var}`, using {default}")
+        return default
+
+
+PEP508_CACHE_SIZE = _int_from_env("VALIDATE_PYPROJECT_PEP508_CACHE_SIZE", 4096)
+"""Maximum number of requirement strings whose validation results are remembered by
+:func:`pep508` (set ``VALIDATE_PYPROJECT_PEP508_CACHE_SIZE=0`` to disable the cache).
+"""
+
 try:
     try:
         from packaging import requirements as _req
@@ -91,10 +214,17 @@ try:
             requirements as _req,
         )
 
+    @functools.lru_cache(maxsize=PEP508_CACHE_SIZE)
     def pep508(value: str) -> bool:
         """See :ref:`PyPA's dependency specifiers <pypa:dependency-specifiers>`
         (initially introduced in :pep:`508`).
+
+        The results are kept in a LRU cache (see :obj:`PEP508_CACHE_SIZE`), as the
+        same requirements tend to repeat across documents.
+        Use ``pep508.cache_info()`` for the number of hits and misses.
         """
+        if PEP508_SIMPLE_REGEX.fullmatch(value):
+            return True
         try:
             _req.Requirement(value)
         except _req.InvalidRequirement:
@@ -108,7 +238,7 @@ except ImportError:  # pragma: no cover
         "To enforce validation, please install `packaging`."
     )
 
-    def pep508(value: str) -> bool:  # noqa: ARG001
+    def pep508(value: str) -> bool:  # type: ignore[misc]  # noqa: ARG001
         return True
 
 
@@ -156,29 +286,60 @@ def pep517_backend_reference(value: str) -> bool:
 # Classifiers - PEP 301
 
 
-def _download_classifiers() -> str:
+CLASSIFIERS_TTL = _int_from_env("VALIDATE_PYPROJECT_CLASSIFIERS_TTL", 24 * 60 * 60)
+"""Number of seconds before the list of classifiers downloaded from PyPI (stored in
+``VALIDATE_PYPROJECT_CACHE_DIR``, if set) is revalidated.
+"""
+
+_CLASSIFIERS_FILE = "trove-classifiers.txt"
+
+# Response headers in the cached copy => request headers for revalidation
+_CONDITIONAL_HEADERS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+
+
+def _download_classifiers(validators: dict[str, str] | None = None) -> str:
+    """Download the list of classifiers from PyPI.
+    ``validators`` (e.g. ``ETag`` of a cached copy) are used for a conditional request
+    and updated with the response (see :func:`caching.cached_download`).
+    """
     import ssl
     from email.message import Message
-    from urllib.request import urlopen
+    from urllib.error import HTTPError
+    from urllib.request import Request, urlopen
 
     _TIMEOUT = 10  # seconds; avoids hanging indefinitely in pre-commit hooks
     url = "https://pypi.org/pypi?:action=list_classifiers"
+    validators = {} if validators is None else validators
+    request = Request(url)
+    for name, condition in _CONDITIONAL_HEADERS.items():
+        if name in validators:
+            request.add_header(condition, validators[name])
     context = ssl.create_default_context()
-    with urlopen(url, context=context, timeout=_TIMEOUT) as response:
-        headers = Message()
-        headers["content_type"] = response.getheader("content-type", "text/plain")
-        return response.read().decode(headers.get_param("charset", "utf-8"))  # type: ignore[no-any-return]
+    try:
+        with urlopen(request, context=context, timeout=_TIMEOUT) as response:  # noqa: S310
+            headers = Message()
+            headers["content_type"] = response.getheader("content-type", "text/plain")
+            text = response.read().decode(headers.get_param("charset", "utf-8"))
+            for name in _CONDITIONAL_HEADERS:
+                if response.getheader(name):
+                    validators[name] = response.getheader(name)
+            return text  # type: ignore[no-any-return]
+    except HTTPError as ex:
+        if ex.code == 304:  # Not Modified
+            raise caching.NotModified(url) from ex
+        raise
 
 
 class _TroveClassifier:
     """The ``trove_classifiers`` package is the official way of validating classifiers,
     however this package might not be always available.
-    As a workaround we can still download a list from PyPI.
+    As a workaround we can still download a list from PyPI
+    (kept in ``VALIDATE_PYPROJECT_CACHE_DIR`` for :obj:`CLASSIFIERS_TTL` seconds).
     We also don't want to be over strict about it, so simply skipping silently is an
     option (classifiers will be validated anyway during the upload to PyPI).
     """
 
-    downloaded: Literal[False] | set[str] | None
+    downloaded: Literal[False] | frozenset[str] | None
     """
     None => not cached yet
     False => unavailable
@@ -195,43 +356,157 @@ class _TroveClassifier:
         self._skip_download = True
 
     def __call__(self, value: str) -> bool:
-        if self.downloaded is False or self._skip_download is True:
-            return True
-
-        if os.getenv("NO_NETWORK") or os.getenv("VALIDATE_PYPROJECT_NO_NETWORK"):
-            self.downloaded = False
-            msg = (
-                "Install ``trove-classifiers`` to ensure proper validation. "
-                "Skipping download of classifiers list from PyPI (NO_NETWORK)."
-            )
-            _logger.debug(msg)
-            return True
+        known = self._known()
+        return known is None or value in known or _is_private_classifier(value)
 
+    def _known(self) -> frozenset[str] | None:
+        """All the valid classifiers (``None`` if the list is not available)"""
+        if self._skip_download is True:
+            return None
         if self.downloaded is None:
-            msg = (
-                "Install ``trove-classifiers`` to ensure proper validation. "
-                "Meanwhile a list of classifiers will be downloaded from PyPI."
+            self.downloaded = self._load()
+        return self.downloaded or None
+
+    def _load(self) -> Literal[False] | frozenset[str]:
+        offline = os.getenv("NO_NETWORK") or os.getenv("VALIDATE_PYPROJECT_NO_NETWORK")
+        msg = "Install ``trove-classifiers`` to ensure proper validation. "
+        if not offline:
+            _logger.debug(
+                msg + "Meanwhile a list of classifiers will be downloaded from PyPI."
+            )
+        try:
+            text = caching.cached_download(
+                _download_classifiers,
+                _CLASSIFIERS_FILE,
+                CLASSIFIERS_TTL,
+                offline=bool(offline),
             )
+        except Exception:  # noqa: BLE001
+            _logger.debug("Problem with download, skipping validation")
+            return False
+        if text is None:
+            msg += "Skipping download of classifiers list from PyPI (NO_NETWORK)."
             _logger.debug(msg)
-            try:
-                self.downloaded = set(_download_classifiers().splitlines())
-            except Exception:  # noqa: BLE001
-                self.downloaded = False
-                _logger.debug("Problem with download, skipping validation")
-                return True
+            return False
+        return frozenset(text.splitlines())
 
-        return value in self.downloaded or value.lower().startswith("private ::")
+    def _stamp(self) -> str:
+        """Identify the list of classifiers, without downloading it"""
+        if self._skip_download is True:
+            return "skipped"
+        return caching.download_stamp(_CLASSIFIERS_FILE)
 
 
 try:
     from trove_classifiers import classifiers as _trove_classifiers
 
+    _TROVE_CLASSIFIERS = frozenset(_trove_classifiers)
+
     def trove_classifier(value: str) -> bool:
         """See https://pypi.org/classifiers/"""
-        return value in _trove_classifiers or value.lower().startswith("private ::")
+        return value in _TROVE_CLASSIFIERS or _is_private_classifier(value)
+
+    def _known_classifiers() -> frozenset[str] | None:
+        return _TROVE_CLASSIFIERS
+
+    def _classifiers_stamp() -> str:
+        return ""  # given by the version of ``trove-classifiers``
 
 except ImportError:  # pragma: no cover
-    trove_classifier = _TroveClassifier()
+    _downloaded_classifiers = _TroveClassifier()
+    trove_classifier = _downloaded_classifiers
+
+    def _known_classifiers() -> frozenset[str] | None:
+        return _downloaded_classifiers._known()
+
+    def _classifiers_stamp() -> str:
+        return _downloaded_classifiers._stamp()
+
+
+def _is_private_classifier(value: str) -> bool:
+    # Only the prefix needs to be normalised
+    return value[:10].lower() == "private ::"
+
+
+# The following functions are not formats, so they are kept private
+# (all public functions in this module are considered format functions).
+
+
+def _invalid_classifiers(values: Iterable[str]) -> list[str]:
+    """Batch version of :obj:`trove_classifier`, returning all the invalid values
+    (none, if the list of classifiers is not available).
+    """
+    known = _known_classifiers()
+    if known is None:
+        return []
+    return [v for v in values if v not in known and not _is_private_classifier(v)]
+
+
+def _suggest_classifiers(value: str, limit: builtins.int = 3) -> list[str]:
+    """Valid classifiers similar to ``value`` (e.g. for error messages)"""
+    known = _known_classifiers()
+    if not known:
+        return []
+    return _classifier_trie(known).suggest(value, limit)
+
+
+class _ClassifierTrie:
+    """Classifiers indexed by their (case-insensitive) ``::``-separated segments, so
+    that similar classifiers can be found by only comparing each segment with its
+    siblings (instead of the whole list).
+    """
+
+    __slots__ = ("children", "value")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _ClassifierTrie] = {}
+        self.value: str | None = None
+
+    @classmethod
+    def build(cls, classifiers: Iterable[str]) -> _ClassifierTrie:
+        root = cls()
+        for classifier in sorted(classifiers):
+            node = root
+            for segment in _classifier_segments(classifier):
+                node = node.children.setdefault(segment, cls())
+            node.value = classifier
+        return root
+
+    def suggest(self, value: str, limit: builtins.int = 3) -> list[str]:
+        return self._complete(_classifier_segments(value), limit)
+
+    def _complete(self, segments: list[str], limit: builtins.int) -> list[str]:
+        if not segments:
+            return list(itertools.islice(self._values(), limit))
+        import difflib
+
+        first, *rest = segments
+        if first in self.children:
+            candidates = [first]
+        else:
+            candidates = difflib.get_close_matches(first, self.children, limit)
+            candidates = candidates or [k for k in self.children if first in k]
+        found: list[str] = []
+        for segment in candidates:
+            found += self.children[segment]._complete(rest, limit - len(found))
+            if len(found) >= limit:
+                break
+        return found
+
+    def _values(self) -> Iterator[str]:
+        if self.value is not None:
+            yield self.value
+        for child in self.children.values():
+            yield from child._values()
+
+
+@functools.lru_cache(maxsize=2)
+def _classifier_trie(classifiers: frozenset[str]) -> _ClassifierTrie:
+    return _ClassifierTrie.build(classifiers)
+
+
+def _classifier_segments(classifier: str) -> list[str]:
+    return [segment.strip().lower() for segment in classifier.split("::")]
 
 
 # -------------------------------------------------------------------------------------
@@ -430,13 +705,33 @@ def int(value: builtins.int) -> bool:
     return -(2**63) <= value < 2**63
 
 
+SPDX_CACHE_SIZE = _int_from_env("VALIDATE_PYPROJECT_SPDX_CACHE_SIZE", 1024)
+"""Maximum number of license expressions whose validation results are remembered by
+:func:`SPDX` (set ``VALIDATE_PYPROJECT_SPDX_CACHE_SIZE=0`` to disable the cache).
+"""
+
 try:
     from packaging import licenses as _licenses
 
+    try:
+        from packaging.licenses._spdx import LICENSES as _SPDX_LICENSES
+    except ImportError:  # pragma: no cover
+        _SPDX_LICENSES = {}
+
+    # Lower-cased identifiers (the same lookup ``packaging`` does for each license)
+    _SPDX_IDS = frozenset(_SPDX_LICENSES)
+
+    @functools.lru_cache(maxsize=SPDX_CACHE_SIZE)
     def SPDX(value: str) -> bool:
         """See :ref:`PyPA's License-Expression specification
         <pypa:core-metadata-license-expression>` (added in :pep:`639`).
+
+        Single license identifiers (e.g. ``MIT``) are looked up directly, without
+        parsing the expression. The results are kept in a LRU cache
+        (see :obj:`SPDX_CACHE_SIZE`).
         """
+        if value.lower() in _SPDX_IDS:
+            return True
         try:
             _licenses.canonicalize_license_expression(value)
         except _licenses.InvalidLicenseExpression:
@@ -450,7 +745,7 @@ except ImportError:  # pragma: no cover
         "To enforce validation, please install `packaging>=24.2`."
     )
 
-    def SPDX(value: str) -> bool:  # noqa: ARG001
+    def SPDX(value: str) -> bool:  # type: ignore[misc]  # noqa: ARG001
         return True
 
 
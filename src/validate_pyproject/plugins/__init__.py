@@ -7,7 +7,13 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import os
+import sys
 import typing
+from contextlib import suppress
 from importlib.metadata import EntryPoint, entry_points
 from itertools import chain
 from string import Template
@@ -19,15 +25,19 @@ from typing import (
     Protocol,
 )
 
-from .. import __version__
+from .. import __version__, caching, profiling
 
 if typing.TYPE_CHECKING:
     from collections.abc import Generator, Iterable
+    from pathlib import Path
 
     from ..types import Plugin, Schema
 
 _DEFAULT_MULTI_PRIORITY = 0
 _DEFAULT_TOOL_PRIORITY = 1
+_CACHED_GROUPS = ("validate_pyproject.tool_schema", "validate_pyproject.multi_schema")
+
+_logger = logging.getLogger(__name__)
 
 
 class PluginProtocol(Protocol):
@@ -51,6 +61,7 @@ class PluginWrapper:
     def __init__(self, tool: str, load_fn: Plugin):
         self._tool = tool
         self._load_fn = load_fn
+        self._schema: Schema | None = None
 
     @property
     def id(self) -> str:
@@ -62,7 +73,9 @@ class PluginWrapper:
 
     @property
     def schema(self) -> Schema:
-        return self._load_fn(self.tool)
+        if self._schema is None:
+            self._schema = self._load_fn(self.tool)
+        return self._schema
 
     @property
     def fragment(self) -> str:
@@ -138,8 +151,18 @@ def iterate_entry_points(group: str) -> Iterable[EntryPoint]:
     This method can be used in conjunction with :obj:`load_from_entry_point` to filter
     the plugins before actually loading them. The entry points are not
     deduplicated.
+
+    When the ``VALIDATE_PYPROJECT_CACHE_DIR`` environment variable is set, the
+    entry points for the plugin groups are cached, so that ``sys.path`` is only
+    scanned again when its entries (or their modification times) change.
     """
-    entries = entry_points()
+    cache_dir = caching.local_dir("entry-points")
+    if cache_dir and group in _CACHED_GROUPS:
+        return _cached_entry_points(group, cache_dir)
+    return _select_entry_points(entry_points(), group)
+
+
+def _select_entry_points(entries: Any, group: str) -> Iterable[EntryPoint]:
     if hasattr(entries, "select"):  # pragma: no cover
         # The select method was introduced in importlib_metadata 3.9 (and Python 3.10)
         # and the previous dict interface was declared deprecated
@@ -154,6 +177,35 @@ def iterate_entry_points(group: str) -> Iterable[EntryPoint]:
     return (plugin for plugin in entries.get(group, []))
 
 
+def _cached_entry_points(group: str, cache_dir: Path) -> list[EntryPoint]:
+    search_path = [os.path.abspath(p) for p in sys.path]
+    key = hashlib.sha256(json.dumps(search_path).encode()).hexdigest()
+    cache_file = cache_dir / f"{key}.json"
+    stamps = [_mtime(p) for p in search_path]
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        if cached["stamps"] == stamps:
+            _logger.debug(f"Using cached entry points from {cache_file}")
+            return [EntryPoint(name, value, group) for name, value in cached[group]]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    entries = entry_points()
+    found = {g: list(_select_entry_points(entries, g)) for g in _CACHED_GROUPS}
+    contents = {g: [[e.name, e.value] for e in eps] for g, eps in found.items()}
+    with suppress(OSError):
+        caching.write_atomic(cache_file, json.dumps({"stamps": stamps, **contents}))
+        _logger.debug(f"Caching entry points into {cache_file}")
+    return found[group]
+
+
+def _mtime(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
 def load_from_entry_point(entry_point: EntryPoint) -> PluginWrapper:
     """Carefully load the plugin, raising a meaningful message in case of errors"""
     try:
@@ -218,20 +270,21 @@ def list_from_entry_points(
             loaded and included (or not) in the final list. A ``True`` return means the
             plugin should be included.
     """
-    tool_eps = (
-        _SortablePlugin(e.name, load_from_entry_point(e))
-        for e in iterate_entry_points("validate_pyproject.tool_schema")
-        if filtering(e)
-    )
-    multi_eps = (
-        _SortablePlugin(e.name, p)
-        for e in iterate_entry_points("validate_pyproject.multi_schema")
-        if filtering(e)
-        for p in load_from_multi_entry_point(e)
-    )
-    eps = chain(tool_eps, multi_eps)
-    dedup = {e.key(): e.plugin for e in sorted(eps)}
-    return list(dedup.values())
+    with profiling.phase("plugins"):
+        tool_eps = (
+            _SortablePlugin(e.name, load_from_entry_point(e))
+            for e in iterate_entry_points("validate_pyproject.tool_schema")
+            if filtering(e)
+        )
+        multi_eps = (
+            _SortablePlugin(e.name, p)
+            for e in iterate_entry_points("validate_pyproject.multi_schema")
+            if filtering(e)
+            for p in load_from_multi_entry_point(e)
+        )
+        eps = chain(tool_eps, multi_eps)
+        dedup = {e.key(): e.plugin for e in sorted(eps)}
+        return list(dedup.values())
 
 
 class ErrorLoadingPlugin(RuntimeError):
@@ -54,6 +54,7 @@ def pre_compile(  # noqa: PLR0913
     copy_fastjsonschema_exceptions(out, replacements)
     copy_module("extra_validations", out, replacements)
     copy_module("formats", out, replacements)
+    copy_module("caching", out, replacements)  # used by ``formats``
     copy_module("error_reporting", out, replacements)
     write_main(out / main_file, validator.schema, replacements)
     write_notice(out, main_file, original_cmd, replacements)
@@ -62,6 +63,27 @@ def pre_compile(  # noqa: PLR0913
     return out
 
 
+def bundle(output_dir: str | os.PathLike, plugins: Sequence[PluginProtocol]) -> Path:
+    """Generate a package in ``output_dir`` containing the validation code for the
+    given ``plugins`` together with its :obj:`~validate_pyproject.api.Validator.fingerprint`.
+
+    This is used when building ``validate-pyproject`` itself, so that the validation
+    code for the built-in plugins is shipped pre-compiled.
+    :obj:`~validate_pyproject.api.Validator` objects use it automatically when their
+    fingerprint matches, falling back to runtime compilation otherwise.
+
+    :meta private: (low level detail)
+    """
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    validator = api.Validator(plugins)
+    fingerprint = validator.fingerprint  # fastjsonschema modifies the schemas in-place
+    header = "\n".join(NOCHECK_HEADERS)
+    _write(out / "validations.py", header + validator.generated_code)
+    _write(out / "__init__.py", f"FINGERPRINT = {fingerprint!r}")
+    return out
+
+
 def replace_text(text: str, replacements: dict[str, str]) -> str:
     for orig, subst in replacements.items():
         text = text.replace(orig, subst)
@@ -11,14 +11,14 @@ from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, NamedTuple
 
 from .. import cli
-from ..plugins import PluginProtocol, PluginWrapper
-from ..plugins import list_from_entry_points as list_plugins_from_entry_points
 from ..remote import RemotePlugin, load_store
 from . import pre_compile
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
 
+    from ..plugins import PluginProtocol, PluginWrapper
+
 if sys.platform == "win32":  # pragma: no cover
     from subprocess import list2cmdline as arg_join
 else:  # pragma: no cover
@@ -108,7 +108,7 @@ def parser_spec(
 def run(args: Sequence[str] = ()) -> int:
     args = args or sys.argv[1:]
     cmd = f"python -m {_PARENT} " + arg_join(args)
-    plugins = list_plugins_from_entry_points()
+    plugins = cli.load_plugins(args)
     desc = 'Generate files for "pre-compiling" `validate-pyproject`'
     prms = cli.parse_args(args, plugins, desc, parser_spec, CliParams)
     cli.setup_logging(prms.loglevel)
@@ -0,0 +1,180 @@
+"""Lightweight instrumentation recording how long each phase of the validation
+takes (e.g. plugin discovery, compilation, TOML parsing, JSON Schema checks, ...).
+
+Phases are only timed inside a :func:`profile` context, otherwise the overhead is
+limited to checking a :class:`~contextvars.ContextVar`::
+
+    with profile() as prof:
+        validator(pyproject)
+    print(prof.format_table())
+
+When phases are nested (e.g. ``formats`` inside ``schema``), the time spent in the
+inner phase is not counted for the outer one, so the durations add up to the total.
+
+:func:`counted_formats` provides a finer-grained (and permanent) view of the format
+functions, used by :meth:`api.Validator.stats <validate_pyproject.api.Validator.stats>`.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Mapping
+
+    from .types import FormatValidationFn
+
+Callback = Callable[[str, float], None]
+"""Called with the name and the duration (in seconds) of each completed phase"""
+
+_ACTIVE: ContextVar[Profile | None] = ContextVar("validate_pyproject_profile")
+
+
+class Profile:
+    """Cumulative durations (in seconds, excluding nested phases) and number of
+    occurrences of each phase.
+    """
+
+    def __init__(self, callback: Callback | None = None):
+        self.durations: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+        self.callback = callback
+        self._start = time.perf_counter()
+        self._stack: list[list[Any]] = []  # [name, start, time in nested phases]
+
+    def _enter(self, name: str) -> None:
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _exit(self) -> None:
+        name, start, nested = self._stack.pop()
+        elapsed = time.perf_counter() - start
+        if self._stack:
+            self._stack[-1][2] += elapsed
+        self.durations[name] = self.durations.get(name, 0.0) + elapsed - nested
+        self.counts[name] = self.counts.get(name, 0) + 1
+        if self.callback:
+            self.callback(name, elapsed)
+
+    @property
+    def total(self) -> float:
+        """Time since the profile started"""
+        return time.perf_counter() - self._start
+
+    def as_dict(self) -> dict[str, Any]:
+        phases = {
+            name: {"count": self.counts[name], "seconds": duration}
+            for name, duration in self.durations.items()
+        }
+        return {"phases": phases, "total": self.total}
+
+    def format_json(self) -> str:
+        return json.dumps(self.as_dict(), indent=2)
+
+    def format_table(self) -> str:
+        total = self.total
+        lines = [f"{'phase':<20} {'count':>8} {'seconds':>10} {'%':>6}"]
+        for name, duration in self.durations.items():
+            share = 100 * duration / total if total else 0
+            count = self.counts[name]
+            lines.append(f"{name:<20} {count:>8} {duration:>10.4f} {share:>6.1f}")
+        lines.append(f"{'total':<20} {'':>8} {total:>10.4f} {100:>6.1f}")
+        return "\n".join(lines)
+
+
+@contextmanager
+def profile(callback: Callback | None = None) -> Generator[Profile, None, None]:
+    """Record the phases executed inside the context in a new :class:`Profile`"""
+    prof = Profile(callback)
+    token = _ACTIVE.set(prof)
+    try:
+        yield prof
+    finally:
+        _ACTIVE.reset(token)
+
+
+def enabled() -> bool:
+    return _ACTIVE.get(None) is not None
+
+
+class _Phase:
+    __slots__ = ("_name", "_profile")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._profile: Profile | None = None
+
+    def __enter__(self) -> None:
+        self._profile = _ACTIVE.get(None)
+        if self._profile is not None:
+            self._profile._enter(self._name)
+
+    def __exit__(self, *_: object) -> None:
+        if self._profile is not None:
+            self._profile._exit()
+
+
+def phase(name: str) -> _Phase:
+    """Context manager timing a phase (when a :func:`profile` is active)"""
+    return _Phase(name)
+
+
+def timed_formats(
+    formats: Mapping[str, FormatValidationFn],
+) -> dict[str, FormatValidationFn]:
+    """Wrap the format functions, so that they are recorded as the ``formats`` phase"""
+    return {name: _timed(fn) for name, fn in formats.items()}
+
+
+def _timed(fn: FormatValidationFn) -> FormatValidationFn:
+    def _wrapper(value: str) -> bool:
+        with phase("formats"):
+            return fn(value)
+
+    return _wrapper
+
+
+class FormatStats:
+    """Number of calls, cache hits and cumulative time (in seconds) of a format
+    function. Cache hits are only counted for functions exposing ``cache_info()``
+    (e.g. :func:`functools.lru_cache`).
+    """
+
+    __slots__ = ("calls", "hits", "seconds")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.hits = 0
+        self.seconds = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"calls": self.calls, "hits": self.hits, "seconds": self.seconds}
+
+
+def counted_formats(
+    formats: Mapping[str, FormatValidationFn],
+) -> tuple[dict[str, FormatValidationFn], dict[str, FormatStats]]:
+    """Wrap the format functions, so that each call updates a :class:`FormatStats`"""
+    stats = {name: FormatStats() for name in formats}
+    wrappers = {name: _counted(fn, stats[name]) for name, fn in formats.items()}
+    return wrappers, stats
+
+
+def _counted(fn: FormatValidationFn, stats: FormatStats) -> FormatValidationFn:
+    cache_info = getattr(fn, "cache_info", None)
+
+    def _wrapper(value: str) -> bool:
+        hits = cache_info().hits if cache_info else 0
+        start = time.perf_counter()
+        try:
+            return fn(value)
+        finally:
+            stats.seconds += time.perf_counter() - start
+            stats.calls += 1
+            if cache_info:
+                stats.hits += cache_info().hits - hits
+
+    return _wrapper
@@ -5,7 +5,7 @@ import logging
 import typing
 import urllib.parse
 
-from . import caching, errors, http
+from . import caching, errors, http, profiling
 
 if typing.TYPE_CHECKING:
     import sys
@@ -29,14 +29,15 @@ def load_from_uri(
     tool_uri: str, cache_dir: caching.PathLike | None = None
 ) -> tuple[str, Schema]:
     tool_info = urllib.parse.urlparse(tool_uri)
-    if tool_info.netloc:
-        url = f"{tool_info.scheme}://{tool_info.netloc}{tool_info.path}"
-        download = caching.as_file(http.open_url, url, cache_dir)
-        with download as f:
-            contents = json.load(f)
-    else:
-        with open(tool_info.path, "rb") as f:
-            contents = json.load(f)
+    with profiling.phase("remote"):
+        if tool_info.netloc:
+            url = f"{tool_info.scheme}://{tool_info.netloc}{tool_info.path}"
+            download = caching.as_file(http.open_url, url, cache_dir)
+            with download as f:
+                contents = json.load(f)
+        else:
+            with open(tool_info.path, "rb") as f:
+                contents = json.load(f)
     return tool_info.fragment, contents
 
 
@@ -16,7 +16,7 @@ class VPP001:
 
     @staticmethod
     def check(pyproject: dict[str, Any]) -> str:
-        validator = api.Validator()
+        validator = api.get_validator()
         try:
             validator(pyproject)
         except fastjsonschema.JsonSchemaValueException as e:
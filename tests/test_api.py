@@ -1,11 +1,15 @@
+import json
+import pickle
 from collections.abc import Mapping
-from functools import partial, wraps
+from functools import lru_cache, partial, wraps
+from unittest.mock import Mock
 
 import fastjsonschema as FJS
 import pytest
 
+from validate_pyproject import _resources, api, error_reporting, errors, plugins, types
 from validate_pyproject import _tomllib as tomllib
-from validate_pyproject import api, errors, plugins, types
+from validate_pyproject.extra_validations import RedefiningStaticFieldAsDynamic
 
 PYPA_SPECS = "https://packaging.python.org/en/latest/specifications"
 
@@ -20,6 +24,22 @@ def test_load():
     assert spec["$id"] == f"{PYPA_SPECS}/pyproject-toml/"
 
 
+def test_load_cached():
+    spec = api.load("project_metadata")
+    assert spec is api.load("project_metadata")
+
+    # Neither the registry nor the compilation should modify the shared objects
+    pristine = json.loads(
+        _resources.read_text(api._PARENT, "project_metadata.schema.json")
+    )
+    top_level = json.loads(json.dumps(api.load("pyproject_toml")))
+    validator = api.Validator()
+    validator({"project": {"name": "proj", "version": "42"}})
+    assert api.load("project_metadata") == pristine
+    assert api.load("pyproject_toml") == top_level
+    assert validator.fingerprint == api.Validator().fingerprint
+
+
 def test_load_plugin():
     spec = api.load_builtin_plugin("distutils")
     assert spec["$id"].startswith("https://setuptools.pypa.io")
@@ -168,3 +188,229 @@ class TestValidator:
 
             assert "setuptools" not in json.dumps(main_schema)
             raise
+
+    def test_fingerprint(self):
+        fingerprint = api.Validator().fingerprint
+        assert fingerprint == api.Validator().fingerprint
+        assert fingerprint != api.Validator([self.plugin("distutils")]).fingerprint
+        formats = {**api.FORMAT_FUNCTIONS, "custom": lambda _: True}
+        assert fingerprint != api.Validator(format_validators=formats).fingerprint
+
+    def test_compiled_cache(self, tmp_path, monkeypatch):
+        validator = api.Validator(cache_dir=tmp_path)
+        assert validator(self.valid_example) is not None
+        cached = list((tmp_path / "compiled").glob("*.py"))
+        assert [p.name for p in cached] == [f"fjs_{validator.fingerprint}.py"]
+        assert cached[0].read_text("utf-8") == validator.generated_code
+
+        # Warm start: no code generation should be necessary
+        for fn in ("compile", "compile_to_code"):
+            monkeypatch.setattr(FJS, fn, Mock(side_effect=RuntimeError("no!")))
+        validator = api.Validator(cache_dir=tmp_path)
+        assert validator(self.valid_example) is not None
+        assert validator.generated_code == cached[0].read_text("utf-8")
+        with pytest.raises(FJS.JsonSchemaValueException):
+            validator(self.invalid_example)
+
+    def test_compiled_cache_corrupted(self, tmp_path):
+        validator = api.Validator(cache_dir=tmp_path)
+        path = tmp_path / "compiled" / f"fjs_{validator.fingerprint}.py"
+        path.parent.mkdir(parents=True)
+        path.write_text("raise ImportError", encoding="utf-8")
+        # Falls back to compiling in memory
+        assert validator(self.valid_example) is not None
+        with pytest.raises(FJS.JsonSchemaValueException):
+            validator(self.invalid_example)
+
+    def test_lazy_tools(self):
+        validator = api.Validator(lazy_tools=True)
+        assert validator(self.valid_example) is not None
+        assert list(validator._tool_validators) == ["setuptools"]
+        with pytest.raises(FJS.JsonSchemaValueException, match=r"tool\.setuptools"):
+            validator(self.invalid_example)
+        assert validator({"project": {"name": "proj", "version": "42"}})
+        assert list(validator._tool_validators) == ["setuptools"]
+
+    @pytest.mark.parametrize(
+        ("key", "value"),
+        [("project", {"name": 42}), ("dependency-groups", {"dev": 42}), ("extra", 42)],
+    )
+    def test_lazy_tools_same_error(self, key, value):
+        example = {**self.invalid_example, key: value}
+        with pytest.raises(FJS.JsonSchemaValueException) as expected:
+            api.Validator()(example)
+        with pytest.raises(FJS.JsonSchemaValueException) as lazy:
+            api.Validator(lazy_tools=True)(example)
+        assert lazy.value.message == expected.value.message
+        assert lazy.value.rule == expected.value.rule
+        assert lazy.value.definition == expected.value.definition
+
+    def test_lazy_tools_cache(self, tmp_path, monkeypatch):
+        validator = api.Validator(cache_dir=tmp_path, lazy_tools=True)
+        assert validator(self.valid_example) is not None
+        assert len(list((tmp_path / "compiled").glob("*.py"))) == 2  # root + tool
+
+        for fn in ("compile", "compile_to_code"):
+            monkeypatch.setattr(FJS, fn, Mock(side_effect=RuntimeError("no!")))
+        validator = api.Validator(cache_dir=tmp_path, lazy_tools=True)
+        with pytest.raises(FJS.JsonSchemaValueException, match=r"tool\.setuptools"):
+            validator(self.invalid_example)
+
+    def test_validate_many(self, monkeypatch):
+        dynamic = {"project": {"name": "proj", "version": "42", "dynamic": ["version"]}}
+        documents = [self.valid_example, self.invalid_example, dynamic]
+        validator = api.Validator()
+        formatted = []
+        to_str = error_reporting._ErrorFormatting.__str__
+        monkeypatch.setattr(
+            error_reporting._ErrorFormatting,
+            "__str__",
+            lambda self: formatted.append(self) or to_str(self),
+        )
+
+        results = list(validator.validate_many(iter(documents)))
+        assert [r.position for r in results] == [0, 1, 2]
+        assert [r.ok for r in results] == [True, False, False]
+        assert results[0].error is None
+        assert results[1].name == "data.tool.setuptools.zip-safe"
+        assert results[1].rule == "type"
+        assert results[2].name == "data.project.version"
+        assert results[2].rule == "PEP 621"
+        assert formatted == []
+        assert results[1].error is results[1].error  # converted only once
+        assert isinstance(results[2].error, RedefiningStaticFieldAsDynamic)
+
+        for result, document in zip(results[1:], documents[1:]):
+            with pytest.raises(api.ValidationError) as exc_info:
+                validator(document)
+            assert str(result.error) == str(exc_info.value)
+            assert result.error.summary == exc_info.value.summary
+
+    def test_is_valid(self, monkeypatch):
+        dynamic = {"project": {"name": "proj", "version": "42", "dynamic": ["version"]}}
+        validator = api.Validator()
+        formatting = Mock(wraps=api.ValidationError._from_jsonschema)
+        monkeypatch.setattr(api.ValidationError, "_from_jsonschema", formatting)
+
+        assert validator.is_valid(self.valid_example) is True
+        assert validator.is_valid(self.invalid_example) is False
+        assert validator.is_valid(dynamic) is False
+        formatting.assert_not_called()
+
+    def test_stats(self):
+        assert api.Validator().stats() == {}
+
+        cached = lru_cache(maxsize=None)(lambda value: value.islower())
+        formats = {**api.FORMAT_FUNCTIONS, "pep508-identifier": cached}
+        validator = api.Validator(format_validators=formats, collect_stats=True)
+        assert validator.formats["pep508-identifier"] is cached
+        example = {"project": {"name": "proj", "version": "42"}}
+        for name in ("proj", "proj", "Proj"):
+            example["project"]["name"] = name
+            validator.is_valid(example)
+
+        stats = validator.stats()
+        assert stats["pep508-identifier"]["calls"] == 3
+        assert stats["pep508-identifier"]["hits"] == 1
+        assert stats["pep508-identifier"]["seconds"] > 0
+        assert stats["pep440"]["calls"] == 2
+        assert stats["pep508"] == {"calls": 0, "hits": 0, "seconds": 0.0}
+
+    def test_all_errors(self):
+        example = self.invalid_example
+        example["project"] = {"name": 42, "version": "42", "dynamic": ["version"]}
+        example["build-system"] = {"requires": "setuptools"}
+        validator = api.Validator()
+        with pytest.raises(errors.ValidationErrors) as exc_info:
+            validator(example, collect="all")
+        found = exc_info.value.errors
+        assert [(ex.name, ex.rule) for ex in found] == [
+            ("`build-system.requires`", "type"),
+            ("`project.name`", "type"),
+            ("`tool.setuptools.zip-safe`", "type"),
+            ("`project.version`", "PEP 621"),
+        ]
+        # Extra validations are reported as in the default mode
+        only_dynamic = {"project": {**example["project"], "name": "proj"}}
+        with pytest.raises(errors.ValidationError) as first:
+            validator(only_dynamic)
+        assert first.value.name == found[-1].name
+        assert first.value.summary == found[-1].summary != ""
+        assert "4 validation errors found" in str(exc_info.value)
+        assert all(str(ex) in str(exc_info.value) for ex in found)
+
+        clone = pickle.loads(pickle.dumps(exc_info.value))
+        assert str(clone) == str(exc_info.value)
+        assert [str(ex) for ex in clone.errors] == [str(ex) for ex in found]
+
+        assert validator(self.valid_example, collect="all") is not None
+
+    def test_all_errors_sectionwise(self, monkeypatch):
+        # Older versions of fastjsonschema do not support ``fast_fail=False``
+        # (nor define ``JsonSchemaValuesException``)
+        monkeypatch.setattr(api, "_COLLECTS_ALL_ERRORS", False)
+        monkeypatch.delattr(api.FJS, "JsonSchemaValuesException", raising=False)
+        project = {"name": 42, "version": "42"}
+        example = {**self.invalid_example, "project": project, "extra": 42}
+        with pytest.raises(errors.ValidationErrors) as exc_info:
+            api.Validator()(example, collect="all")
+        assert [ex.name for ex in exc_info.value.errors] == [
+            "`project.name`",
+            "`tool.setuptools.zip-safe`",
+            "`data`",
+        ]
+
+    def test_invalid_collect(self):
+        with pytest.raises(ValueError, match="'first' or 'all'"):
+            api.Validator()(self.valid_example, collect="everything")  # type: ignore[arg-type]
+
+
+class TestSharedValidators:
+    @pytest.fixture(autouse=True)
+    def _clear(self):
+        api._SHARED_VALIDATORS.clear()
+        yield
+        api._SHARED_VALIDATORS.clear()
+
+    def plugin(self, tool):
+        return plugins.list_from_entry_points(filtering=lambda e: e.name == tool)[0]
+
+    def test_get_validator(self):
+        validator = api.get_validator()
+        assert validator is api.get_validator()
+        assert validator._cache is not None  # already compiled
+
+        plg = [self.plugin("setuptools")]
+        other = api.get_validator(plg)
+        assert other is not validator
+        # Identity is given by the plugins, not by the objects
+        assert other is api.get_validator([self.plugin("setuptools")])
+        assert other is not api.get_validator([], extra_plugins=plg)
+
+    def test_same_id_different_schema(self):
+        def _plugin(description):
+            schema = {"$id": "https://example.com/plg.schema.json", "type": "object"}
+            return plugins.StoredPlugin(
+                "plg", {**schema, "description": description}, "plg", 0
+            )
+
+        validator = api.get_validator([], extra_plugins=[_plugin("1")])
+        assert validator is not api.get_validator([], extra_plugins=[_plugin("2")])
+
+    def test_lru_eviction(self):
+        shared = api._SharedValidators(maxsize=1)
+        validator = shared.get([], ())
+        assert shared.get([], ()) is validator
+        shared.get([self.plugin("distutils")], ())
+        assert shared.get([], ()) is not validator
+
+
+def test_invalid_classifiers():
+    classifiers = [
+        "Framework :: Django",
+        "Framework :: Djnago",
+        "Private :: Do Not Upload",
+        "Programming Language :: Python :: 3 :: only",
+    ]
+    assert api.invalid_classifiers(classifiers) == [classifiers[1], classifiers[3]]
+    assert api.invalid_classifiers(iter(classifiers[:1])) == []
@@ -86,3 +86,115 @@ class TestIntegration:
 
         assert "build-system" in contents["properties"]
         open_url.assert_not_called()
+
+
+def test_local_dir(tmp_path, monkeypatch):
+    assert caching.local_dir("compiled") is None
+    assert caching.local_dir("compiled", tmp_path) == tmp_path / "compiled"
+
+    monkeypatch.setenv("VALIDATE_PYPROJECT_CACHE_DIR", str(tmp_path))
+    assert caching.local_dir("compiled") == tmp_path / "compiled"
+
+
+def test_write_atomic(tmp_path):
+    path = tmp_path / "nested/dir/file.txt"
+    caching.write_atomic(path, "hello")
+    assert path.read_text("utf-8") == "hello"
+
+    caching.write_atomic(path, "world")
+    assert path.read_text("utf-8") == "world"
+    assert [p.name for p in path.parent.iterdir()] == ["file.txt"]  # no leftovers
+
+
+def test_as_module(tmp_path):
+    path = tmp_path / "mod.py"
+    module = caching.as_module(lambda: "answer = 42", path)
+    assert module.answer == 42
+    assert path.exists()
+
+    # Any further calls should reuse the file and NOT call the function
+    module = caching.as_module(lambda: fn2(""), path)
+    assert module.answer == 42
+
+
+class TestCachedDownload:
+    def download(self, text, etag="v1"):
+        def _download(validators):
+            if validators.get("ETag") == etag:
+                raise caching.NotModified
+            validators["ETag"] = etag
+            return text
+
+        return Mock(side_effect=_download)
+
+    def test_no_cache(self, monkeypatch):
+        monkeypatch.delenv("VALIDATE_PYPROJECT_CACHE_DIR", raising=False)
+        download = self.download("hello")
+        assert caching.cached_download(download, "file", 60) == "hello"
+        download.assert_called_once()
+        assert caching.cached_download(download, "file", 60, offline=True) is None
+
+    def test_ttl(self, tmp_path):
+        download = self.download("hello")
+        text = caching.cached_download(download, "file", 60, cache=tmp_path)
+        assert text == "hello"
+        assert (tmp_path / "downloads/file").read_text("utf-8") == "hello"
+        download.assert_called_once_with({"ETag": "v1"})  # updated in-place
+
+        # Within the TTL the cached copy is used without revalidation
+        download.reset_mock()
+        assert caching.cached_download(download, "file", 60, cache=tmp_path) == "hello"
+        download.assert_not_called()
+
+    def test_revalidation(self, tmp_path):
+        caching.cached_download(self.download("hello"), "file", 0, cache=tmp_path)
+        path = tmp_path / "downloads/file"
+        os.utime(path, (0, 0))
+
+        download = self.download("world")
+        assert caching.cached_download(download, "file", 0, cache=tmp_path) == "hello"
+        download.assert_called_once_with({"ETag": "v1"})
+        assert path.stat().st_mtime > 0  # refreshed
+
+        download = self.download("world", etag="v2")
+        assert caching.cached_download(download, "file", 0, cache=tmp_path) == "world"
+        assert path.read_text("utf-8") == "world"
+
+    def test_offline(self, tmp_path):
+        download = Mock(side_effect=OSError("network is unreachable"))
+        with pytest.raises(OSError, match="unreachable"):
+            caching.cached_download(download, "file", 0, cache=tmp_path)
+        assert (
+            caching.cached_download(download, "file", 0, cache=tmp_path, offline=True)
+            is None
+        )
+
+        caching.cached_download(self.download("hello"), "file", 0, cache=tmp_path)
+        download.reset_mock()
+        assert caching.cached_download(download, "file", 0, cache=tmp_path) == "hello"
+        download.assert_called_once()
+        text = caching.cached_download(
+            download, "file", 0, cache=tmp_path, offline=True
+        )
+        assert text == "hello"
+        download.assert_called_once()
+
+    def test_download_stamp(self, tmp_path):
+        assert caching.download_stamp("file", cache=tmp_path) == ""
+        caching.cached_download(self.download("hello"), "file", 0, cache=tmp_path)
+        stamp = caching.download_stamp("file", cache=tmp_path)
+        assert "v1" in stamp
+
+        # Revalidation keeps the stamp, a new version changes it
+        os.utime(tmp_path / "downloads/file", (0, 0))
+        caching.cached_download(self.download("world"), "file", 0, cache=tmp_path)
+        assert caching.download_stamp("file", cache=tmp_path) == stamp
+        download = self.download("world", etag="v2")
+        caching.cached_download(download, "file", 0, cache=tmp_path)
+        assert caching.download_stamp("file", cache=tmp_path) != stamp
+
+        # Without validators the modification time is used
+        (tmp_path / "downloads/file.json").write_text("{}", "utf-8")
+        stamp = caching.download_stamp("file", cache=tmp_path)
+        os.utime(tmp_path / "downloads/file", (0, 0))
+        assert caching.download_stamp("file", cache=tmp_path) != stamp
@@ -2,6 +2,7 @@ import inspect
 import io
 import logging
 import sys
+from importlib.metadata import EntryPoint
 from pathlib import Path
 from unittest.mock import Mock
 from uuid import uuid4
@@ -123,6 +124,65 @@ class TestDisable:
         assert cli.main([str(invalid_example), "-D", "setuptools"]) == 0
 
 
+@pytest.mark.parametrize("args", [["-E"], ["--prof"], ["--daemon=yes"]])
+def test_invalid_pre_parsed_options(capsys, args):
+    # Errors are reported by the main parser, with the complete usage
+    with pytest.raises(SystemExit) as exc_info:
+        cli.run(args)
+    assert exc_info.value.code == 2
+    err = capsys.readouterr().err
+    assert "--dump-json" in err
+    assert err.count("error:") == 1
+
+
+class TestSelectionBeforeLoading:
+    BROKEN = "mypkg.SOOOOO___fake___:activate"  # Loading this would raise an error
+
+    @pytest.fixture(autouse=True)
+    def broken_plugins(self, monkeypatch):
+        orig = plugins.iterate_entry_points
+
+        def _iterate_entry_points(group):
+            if not group.endswith("tool_schema"):
+                return orig(group)
+            return [*orig(group), EntryPoint("broken", self.BROKEN, group)]
+
+        monkeypatch.setattr(plugins, "iterate_entry_points", _iterate_entry_points)
+
+    def test_broken_plugins(self, valid_example):
+        with pytest.raises(plugins.ErrorLoadingPlugin):
+            cli.run([str(valid_example)])
+
+    def test_enable(self, valid_example):
+        assert cli.run([str(valid_example), "-E", "setuptools"]) == 0
+        loaded = cli.load_plugins([str(valid_example), "-E", "setuptools"])
+        assert [p.tool for p in loaded] == ["setuptools"]
+
+    def test_disable(self):
+        filtering = cli.select_entry_points(disabled=["broken"])
+        tool_eps = plugins.iterate_entry_points("validate_pyproject.tool_schema")
+        assert [e.name for e in tool_eps if not filtering(e)] == ["broken"]
+
+    def test_multi_plugins_are_loaded(self, monkeypatch, tmp_path):
+        # Plugins with a higher priority can override the ones in ``tool_schema``
+        strict = {"type": "object", "additionalProperties": False}
+        module = f"strict_plugin_{uuid4().hex}"
+        monkeypatch.setitem(sys.modules, module, Mock(f=lambda: multi))
+        schema = {"$id": f"https://example.com/{module}.schema.json", **strict}
+        multi = {"tools": {"setuptools": schema}, "priority": 2}
+        orig = plugins.iterate_entry_points
+
+        def _iterate_entry_points(group):
+            if group.endswith("tool_schema"):
+                return orig(group)
+            return [*orig(group), EntryPoint("strict", f"{module}:f", group)]
+
+        monkeypatch.setattr(plugins, "iterate_entry_points", _iterate_entry_points)
+        example = write_example(tmp_path)
+        with pytest.raises(JsonSchemaValueException, match="must not contain"):
+            cli.run([str(example), "-E", "setuptools"])
+
+
 class TestInput:
     def test_inform_user_about_stdin(self, monkeypatch):
         print_mock = Mock()
@@ -135,6 +195,115 @@ class TestInput:
         calls = print_mock.call_args_list
         assert any("input via `stdin`" in str(args[0]) for args, _kwargs in calls)
 
+    def test_files_are_not_opened_during_parsing(self, tmp_path, monkeypatch):
+        files = [str(write_example(tmp_path, name=f"{i}.toml")) for i in range(3)]
+        open_mock = Mock(side_effect=AssertionError("should not be opened"))
+        monkeypatch.setattr("builtins.open", open_mock)
+        params = cli.parse_args([*files, "-"], [])
+        assert params.input_file == [*map(Path, files), cli._STDIN]
+
+    def test_missing_file(self, tmp_path, capsys):
+        valid = write_example(tmp_path)
+        missing = tmp_path / "missing.toml"
+        with pytest.raises(SystemExit):
+            cli.main(["--jobs", "1", str(valid), str(missing)])
+        assert capsys.readouterr().out.splitlines() == [
+            f"Valid file: {valid}",
+            f"Invalid file: {missing}",
+        ]
+
+
+class TestRecursive:
+    @pytest.fixture
+    def tree(self, tmp_path):
+        for parent in ("", "a", "b/c", ".git", "node_modules/x", "venv", "venv/lib"):
+            (tmp_path / parent).mkdir(parents=True, exist_ok=True)
+            write_example(tmp_path / parent)
+        (tmp_path / "venv/pyvenv.cfg").write_text("", "utf-8")
+        write_invalid_example(tmp_path / "b")
+        return tmp_path
+
+    def test_find_pyproject_files(self, tree):
+        files = list(cli.find_pyproject_files(tree))
+        expected = ["", "a", "b", "b/c"]
+        assert files == [tree / parent / "pyproject.toml" for parent in expected]
+
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_run(self, tree, capsys, jobs):
+        extra = write_example(tree / "venv", name="extra.toml")
+        with pytest.raises(SystemExit):
+            cli.main(["-j", jobs, str(extra), "--recursive", str(tree / "b")])
+        assert capsys.readouterr().out.splitlines() == [
+            f"Valid file: {extra}",
+            f"Valid file: {tree / 'b/c/pyproject.toml'}",
+            f"Invalid file: {tree / 'b/pyproject.toml'}",
+        ]
+
+    def test_not_a_directory(self, tree):
+        with pytest.raises(SystemExit) as exc_info:
+            cli.run(["--recursive", str(tree / "pyproject.toml")])
+        assert exc_info.value.args == (2,)
+
+
+class TestResultCache:
+    @pytest.fixture(autouse=True)
+    def _cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("VALIDATE_PYPROJECT_CACHE_DIR", str(tmp_path / "cache"))
+
+    def test_valid_files_are_skipped(self, tmp_path, monkeypatch, capsys):
+        valid = write_example(tmp_path, name="valid.toml")
+        assert cli.run(["-j", "1", str(valid)]) == 0
+        assert len(list((tmp_path / "cache/results").glob("*/*"))) == 1
+
+        loads = Mock(wraps=cli.tomllib.loads)
+        monkeypatch.setattr(cli.tomllib, "loads", loads)
+        assert cli.run(["-j", "1", str(valid)]) == 0
+        loads.assert_not_called()
+        assert capsys.readouterr().out.splitlines() == [f"Valid file: {valid}"] * 2
+
+        assert cli.run(["-j", "1", "--no-cache", str(valid)]) == 0
+        loads.assert_called_once()
+
+    def test_changed_or_invalid_files(self, tmp_path, monkeypatch):
+        valid = write_example(tmp_path, name="valid.toml")
+        invalid = write_invalid_example(tmp_path, name="invalid.toml")
+        with pytest.raises(SystemExit):
+            cli.main(["-j", "1", str(valid), str(invalid)])
+        valid.write_text(
+            valid.read_text("utf-8").replace("myproj", "otherproj"), "utf-8"
+        )
+
+        loads = Mock(wraps=cli.tomllib.loads)
+        monkeypatch.setattr(cli.tomllib, "loads", loads)
+        with pytest.raises(SystemExit):
+            cli.main(["-j", "1", str(valid), str(invalid)])
+        assert loads.call_count == 2
+
+    def test_format_dependencies(self, tmp_path, monkeypatch):
+        # Results depend on the libraries (and data) behind the format functions
+        valid = write_example(tmp_path, name="valid.toml")
+        assert cli.run(["-j", "1", str(valid)]) == 0
+        loads = Mock(wraps=cli.tomllib.loads)
+        monkeypatch.setattr(cli.tomllib, "loads", loads)
+
+        # The classifiers are not loaded (possibly downloaded) to compute the key
+        known = Mock(side_effect=AssertionError("classifiers loaded"))
+        monkeypatch.setattr(cli.formats, "_known_classifiers", known)
+        monkeypatch.setattr(cli.formats, "_classifiers_stamp", lambda: "new")
+        assert cli.run(["-j", "1", str(valid)]) == 0
+        assert loads.call_count == 1
+        known.assert_not_called()
+
+        version = Mock(return_value="0.0.1")
+        monkeypatch.setattr(cli.metadata, "version", version)
+        assert cli.run(["-j", "1", str(valid)]) == 0
+        assert loads.call_count == 2
+        assert {args for args, _ in version.call_args_list} == {
+            ("fastjsonschema",),
+            ("packaging",),
+            ("trove-classifiers",),
+        }
+
 
 class TestOutput:
     def test_valid(self, capsys, valid_example):
@@ -152,6 +321,21 @@ class TestOutput:
         assert "given value" in captured
         assert '"type": "boolean"' in captured
 
+    def test_all_errors(self, caplog, tmp_path):
+        example = write_invalid_example(tmp_path)
+        text = example.read_text("utf-8").replace("name = ", "name = 42 #")
+        example.write_text(text, "utf-8")
+        with pytest.raises(SystemExit):
+            cli.main([str(example)])
+        assert "`tool.setuptools.zip-safe`" not in caplog.text
+
+        caplog.clear()
+        with pytest.raises(SystemExit):
+            cli.main(["--all-errors", str(example)])
+        assert "2 validation errors found" in caplog.text
+        assert "`project.name` must be string" in caplog.text
+        assert "`tool.setuptools.zip-safe` must be boolean" in caplog.text
+
 
 def test_multiple_files(tmp_path, capsys):
     N = 3
@@ -181,6 +365,48 @@ def test_multiple_files(tmp_path, capsys):
     assert number_invalid == N + 3
 
 
+@pytest.mark.parametrize("jobs", ["1", "3"])
+def test_multiple_files_jobs(tmp_path, capsys, jobs):
+    files = [
+        write_example(tmp_path, name="valid0.toml"),
+        write_invalid_example(tmp_path, name="invalid1.toml"),
+        write_example(tmp_path, name="valid2.toml"),
+        write_invalid_example(tmp_path, name="invalid3.toml"),
+    ]
+    with pytest.raises(SystemExit):
+        cli.main(["--jobs", jobs, *map(str, files)])
+    assert capsys.readouterr().out.splitlines() == [
+        f"Valid file: {files[0]}",
+        f"Valid file: {files[2]}",
+        f"Invalid file: {files[1]}",
+        f"Invalid file: {files[3]}",
+    ]
+
+
+def test_jobs(tmp_path, monkeypatch):
+    files = [str(write_example(tmp_path, name=f"valid{i}.toml")) for i in range(3)]
+    run_parallel = Mock(return_value=iter([]))
+    monkeypatch.setattr(cli, "_run_parallel", run_parallel)
+    assert cli.run(files) == 0
+    run_parallel.assert_not_called()  # processes are only used when requested
+
+    get_validator = Mock(wraps=cli.get_validator)
+    monkeypatch.setattr(cli, "get_validator", get_validator)
+    monkeypatch.setattr(cli.os, "cpu_count", lambda: 2)
+    assert cli.run(["-j", "0", *files]) == 0
+    assert run_parallel.call_args.args[0] == 2
+    get_validator.assert_not_called()  # each process compiles its own
+
+
+@pytest.mark.parametrize("jobs", ["-1", "two"])
+def test_invalid_jobs(tmp_path, capsys, jobs):
+    example = write_example(tmp_path, name="valid.toml")
+    with pytest.raises(SystemExit) as exc_info:
+        cli.run(["-j", jobs, str(example)])
+    assert exc_info.value.code == 2
+    assert f"{jobs!r} is not a non-negative integer" in capsys.readouterr().err
+
+
 def test_missing_toolname(tmp_path):
     example = write_example(tmp_path, name="valid-pyproject.toml")
     with pytest.raises(
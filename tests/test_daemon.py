@@ -0,0 +1,174 @@
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from validate_pyproject import cli, daemon
+
+from .test_cli import write_example, write_invalid_example
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="requires Unix domain sockets"
+)
+
+
+@pytest.fixture
+def socket_path(monkeypatch):
+    # Unix socket paths are limited in length, so `tmp_path` might not work
+    private_dir = Path(tempfile.mkdtemp(prefix="vpp-"))
+    path = private_dir / "daemon.sock"
+    monkeypatch.setenv(daemon.SOCKET_ENV, str(path))
+    yield path
+    shutil.rmtree(private_dir, ignore_errors=True)
+
+
+def start(server: daemon.Server) -> threading.Thread:
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    for _ in range(100):
+        if server.path.exists():
+            break
+        time.sleep(0.05)
+    return thread
+
+
+@pytest.fixture
+def server(socket_path):
+    server = daemon.Server(socket_path, idle_timeout=0.5)
+    thread = start(server)
+    yield server
+    thread.join()
+
+
+@pytest.mark.usefixtures("server")
+def test_forward(tmp_path, monkeypatch):
+    write_example(tmp_path, name="valid.toml")
+    invalid = write_invalid_example(tmp_path, name="invalid.toml")
+    monkeypatch.chdir(tmp_path)
+    results = daemon.forward(["valid.toml", str(invalid)])
+    assert [(file, output) for file, output, _ in results] == [
+        ("file: valid.toml", f"Valid file: {Path('valid.toml')}"),
+        (f"file: {invalid}", ""),
+    ]
+    assert results[0][-1] is None
+    assert isinstance(results[1][-1], daemon.ReportedError)
+    assert "must be boolean" in str(results[1][-1])
+    assert os.getcwd() == str(tmp_path)
+
+    assert daemon.forward(["--recursive", str(tmp_path)]) == []
+
+
+def test_cli(server, tmp_path, capsys, monkeypatch):
+    valid = write_example(tmp_path, name="valid.toml")
+    invalid = write_invalid_example(tmp_path, name="invalid.toml")
+    monkeypatch.setattr(server, "process", Mock(wraps=server.process))
+    with pytest.raises(SystemExit):
+        cli.main(["--daemon", str(valid), str(invalid)])
+    assert capsys.readouterr().out.splitlines() == [
+        f"Valid file: {valid}",
+        f"Invalid file: {invalid}",
+    ]
+    server.process.assert_called_once()
+
+
+@pytest.mark.parametrize("verbosity", [[], ["-vv"]])
+def test_same_output_as_local(socket_path, tmp_path, monkeypatch, verbosity):
+    # Logging is only configured by the CLI, so the client runs in a new process
+    invalid = write_invalid_example(tmp_path, name="invalid.toml")
+
+    def _output(*args):
+        cmd = [sys.executable, "-m", "validate_pyproject", *verbosity, *args]
+        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        assert proc.returncode == 1
+        # Only the error message is compared (the debug logs and frames differ)
+        error = proc.stderr.partition("[ERROR]")[2].partition("Traceback")[0]
+        return proc.stdout, error
+
+    local = _output(str(invalid))
+    assert local[1].startswith(" `tool.setuptools.zip-safe` must be boolean")
+    assert ("DESCRIPTION" in local[1]) == bool(verbosity)
+
+    # Other tests may touch the directories in ``sys.path`` (restarting the server)
+    monkeypatch.setattr(daemon, "_environment_stamps", list)
+    server = daemon.Server(socket_path, idle_timeout=60)
+    server.process = Mock(wraps=server.process)  # type: ignore[method-assign]
+    thread = start(server)
+    assert _output("--daemon", str(invalid)) == local
+    server.process.assert_called_once()
+    server._stamps = ["changed"]  # stop the server with the next request
+    daemon.forward([])
+    thread.join()
+
+
+@pytest.mark.parametrize("args", [[], ["-"], ["--help"], ["--invalid-flag"]])
+@pytest.mark.usefixtures("server")
+def test_fallback(args):
+    assert daemon.forward(args) is None
+
+
+@pytest.mark.usefixtures("socket_path")
+def test_not_running(tmp_path, capsys):
+    valid = write_example(tmp_path, name="valid.toml")
+    assert daemon.forward([str(valid)]) is None
+    assert cli.run(["--daemon", str(valid)]) == 0
+    assert "Valid file" in capsys.readouterr().out
+
+
+def test_idle_timeout(socket_path):
+    server = daemon.Server(socket_path, idle_timeout=0.1)
+    assert server.serve_forever() is False
+    assert not socket_path.exists()
+
+
+def test_restart_when_environment_changes(socket_path, tmp_path, monkeypatch):
+    server = daemon.Server(socket_path, idle_timeout=5)
+    monkeypatch.setattr(daemon, "_environment_stamps", lambda: ["changed"])
+    result = []
+    thread = threading.Thread(target=lambda: result.append(server.serve_forever()))
+    thread.start()
+    while not socket_path.exists():
+        time.sleep(0.05)
+    valid = write_example(tmp_path, name="valid.toml")
+    assert daemon.forward([str(valid)]) is None
+    thread.join()
+    assert result == [True]
+
+
+def test_private_dir(socket_path):
+    assert (socket_path.parent.stat().st_mode & 0o777) == 0o700
+    server = daemon.Server(socket_path, idle_timeout=0.1)
+    socket_path.parent.chmod(0o755)
+    with pytest.raises(PermissionError):
+        server.serve_forever()
+    assert daemon.forward([]) is None
+
+
+@pytest.mark.parametrize("missing", [(socket, "AF_UNIX"), (os, "getuid")])
+def test_unsupported_platform(monkeypatch, capsys, missing):
+    # e.g. Windows: the files are validated locally
+    monkeypatch.delenv(daemon.SOCKET_ENV, raising=False)
+    monkeypatch.delattr(*missing)
+    assert daemon.socket_path() is None
+    assert daemon.forward(["pyproject.toml"]) is None
+
+    with pytest.raises(SystemExit) as exc_info:
+        daemon.run(["--help"])
+    assert exc_info.value.code == 0
+    assert "--socket" in capsys.readouterr().out
+    with pytest.raises(SystemExit) as exc_info:
+        daemon.run([])
+    assert exc_info.value.code == 2
+    assert "not supported" in capsys.readouterr().err
+
+
+def test_already_running(server):
+    with pytest.raises(RuntimeError, match="already listening"):
+        daemon.Server(server.path).serve_forever()
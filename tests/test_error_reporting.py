@@ -1,9 +1,12 @@
 import logging
+import pickle
 from inspect import cleandoc
+from unittest.mock import patch
 
 import pytest
 from fastjsonschema import validate
 
+from validate_pyproject import error_reporting, formats
 from validate_pyproject.api import FORMAT_FUNCTIONS
 from validate_pyproject.error_reporting import ValidationError, detailed_errors
 
@@ -180,3 +183,56 @@ def test_dollar_dollar_description_not_mutated_after_formatting():
     _ = ex.details
     assert ex.definition is not None
     assert "$$description" in ex.definition
+
+
+def test_lazy_formatting(caplog):
+    cls = error_reporting._ErrorFormatting
+    summary = cls._expand_summary
+    details = cls._expand_details
+    schema = EXAMPLES["description"]["schema"]
+    value = EXAMPLES["description"]["value"]
+    with (
+        patch.object(cls, "_expand_summary", autospec=True, side_effect=summary),
+        patch.object(cls, "_expand_details", autospec=True, side_effect=details),
+    ):
+        with (
+            pytest.raises(ValidationError) as excinfo,
+            caplog.at_level(logging.DEBUG),
+            detailed_errors(),
+        ):
+            validate(schema, value, formats=FORMAT_FUNCTIONS)
+        ex = excinfo.value
+        cls._expand_summary.assert_not_called()
+        cls._expand_details.assert_not_called()
+
+        assert "GIVEN VALUE:" in str(ex)  # verbosity when the error was raised
+        assert str(ex) == ex.message
+        assert ex.summary in ex.message
+        cls._expand_summary.assert_called_once()
+        cls._expand_details.assert_called_once()
+
+    clone = pickle.loads(pickle.dumps(ex))
+    assert (clone.message, clone.summary, clone.details) == (
+        ex.message,
+        ex.summary,
+        ex.details,
+    )
+    assert (clone.name, clone.rule, clone.value) == (ex.name, ex.rule, ex.value)
+
+
+def test_format_suggestions(monkeypatch):
+    known = frozenset(("Framework :: Django", "Framework :: Flask"))
+    monkeypatch.setattr(formats, "_known_classifiers", lambda: known)
+    schema = {"type": "string", "format": "trove-classifier"}
+    with pytest.raises(ValidationError) as excinfo, detailed_errors():
+        validate(
+            schema, "Framework :: Djnago", formats={"trove-classifier": lambda _: False}
+        )
+    assert excinfo.value.summary == cleandoc(
+        """
+        `data` must be trove-classifier
+
+        Did you mean:
+            - 'Framework :: Django'
+        """
+    )
@@ -5,7 +5,7 @@ from pathlib import Path
 import pytest
 
 from validate_pyproject import _tomllib as tomllib
-from validate_pyproject import api, cli
+from validate_pyproject import api, cli, errors
 from validate_pyproject.error_reporting import ValidationError
 
 from .helpers import error_file, get_tools, get_tools_as_args
@@ -42,6 +42,31 @@ def test_invalid_examples_api(invalid_example: Path) -> None:
         assert error in summary
 
 
+def test_invalid_examples_lazy_tools(invalid_example: Path) -> None:
+    load_tools = get_tools(invalid_example)
+
+    toml_equivalent = tomllib.loads(invalid_example.read_text())
+    with pytest.raises(ValidationError) as expected:
+        api.Validator(extra_plugins=load_tools)(toml_equivalent)
+    with pytest.raises(ValidationError) as exc_info:
+        api.Validator(extra_plugins=load_tools, lazy_tools=True)(toml_equivalent)
+    assert str(exc_info.value) == str(expected.value)
+    assert exc_info.value.name == expected.value.name
+    assert exc_info.value.rule == expected.value.rule
+
+
+def test_invalid_examples_all_errors(invalid_example: Path) -> None:
+    load_tools = get_tools(invalid_example)
+
+    toml_equivalent = tomllib.loads(invalid_example.read_text())
+    validator = api.Validator(extra_plugins=load_tools)
+    with pytest.raises(ValidationError) as expected:
+        validator(toml_equivalent)
+    with pytest.raises(errors.ValidationErrors) as exc_info:
+        validator(toml_equivalent, collect="all")
+    assert str(expected.value) in [str(ex) for ex in exc_info.value.errors]
+
+
 def test_invalid_examples_cli(invalid_example: Path, caplog) -> None:
     args = get_tools_as_args(invalid_example)
 
@@ -1,11 +1,15 @@
 import logging
 import os
+import random
+import re
+import string
+import sys
 from itertools import chain
 from unittest.mock import Mock
 
 import pytest
 
-from validate_pyproject import api, formats
+from validate_pyproject import api, caching, formats
 
 _chain_iter = chain.from_iterable
 
@@ -203,6 +207,90 @@ def test_invalid_pep440(example):
     assert formats.pep440(example) is False
 
 
+PEP440_CORPUS = [
+    "1",
+    " 1.2.3\n",
+    "\u20031.0\u3000",  # Unicode whitespace
+    "V1.0",
+    "1.0RC1",
+    "1.0-1",
+    "1.0-r1",
+    "1.0a",
+    "1.0a.",
+    "1.0a-",
+    "1.0a-1",
+    "1.0a--1",
+    "1.0rc.-1",
+    "1.0rc-.1",
+    "1.0.post.dev",
+    "1.0.post..dev",
+    "1.0preview1",
+    "1.0prerev",
+    "1.0pre.1.rev.1.dev.1+a-b_c.d",
+    "1!",
+    "!1.0",
+    "1.",
+    ".1",
+    "1..0",
+    "1.0.",
+    "1.0+",
+    "1.0+a.",
+    "1.0+a..b",
+    "1.0 1",
+    "1.0-",
+    "1.0rc1rc1",
+    "1.0dev1post1",
+    # Non-ASCII characters matched by ``re.IGNORECASE``
+    "1.0.po\u017ft1",
+    "1.0.prev\u0131ew",
+    "1.0.prev\u0130ew",
+    "1.0+\u212a",
+    "1.0+\u0130\u0131\u017f",
+    "1.0+\u00e9",
+    "\u0661.0",  # Arabic-Indic digit
+    "1.0\u00b2",  # superscript two
+]
+
+
+def _pep440_reference(value):
+    return formats.VERSION_REGEX.match(value) is not None
+
+
+@pytest.mark.parametrize("example", PEP440_CORPUS)
+def test_pep440_reference(example):
+    assert formats.pep440(example) is _pep440_reference(example)
+
+
+def test_pep440_casefold():
+    # Every non-ASCII character matched by the regex must be in the translation table
+    any_letter = re.compile("[a-z]", re.IGNORECASE)
+    letters = {x: re.compile(x, re.IGNORECASE) for x in string.ascii_lowercase}
+    folded = {}
+    for char in map(chr, range(128, sys.maxunicode + 1)):
+        if any_letter.fullmatch(char):
+            [folded[char]] = [x for x, regex in letters.items() if regex.match(char)]
+    assert folded == {chr(k): v for k, v in formats._PEP440_CASEFOLD.items()}
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_pep440_randomized(seed):
+    rng = random.Random(seed)
+    fragments = [
+        *"0123456789.-_!+vV aAbBcCrR\t\n",
+        *("alpha", "beta", "preview", "pre", "rc", "post", "rev", "dev", "PoSt"),
+        *("1.0", "..", "--", ".post", ".dev", "-1", "\u00e9", "\u0661", "\u00b2"),
+        *map(chr, formats._PEP440_CASEFOLD),
+    ]
+    valid = 0
+    for _ in range(20_000):
+        size = rng.randint(0, 10)
+        example = "".join(rng.choice(fragments) for _ in range(size))
+        expected = _pep440_reference(example)
+        assert formats.pep440(example) is expected, example
+        valid += expected
+    assert valid > 1000
+
+
 @pytest.mark.parametrize(
     "example",
     [
@@ -231,6 +319,117 @@ def test_invalid_pep508_versionspec(example):
     assert formats.pep508_versionspec(example) is False
 
 
+def test_only_formats_are_public():
+    # Callables imported in ``formats`` would be mistaken by format functions
+    for name, fn in api.FORMAT_FUNCTIONS.items():
+        assert fn.__module__ == formats.__name__, name
+
+
+def test_pep508_cache(monkeypatch):
+    requirement = Mock(wraps=formats._req.Requirement)
+    monkeypatch.setattr(formats._req, "Requirement", requirement)
+    formats.pep508.cache_clear()
+    for _ in range(3):
+        assert formats.pep508("numpy>=1.20")
+        assert formats.pep508_versionspec(">=1.20")
+        assert formats.pep508("numpy>>1.20") is False  # invalid results are cached
+    requirement.assert_called_once_with("numpy>>1.20")  # others: regex fast path
+    info = formats.pep508.cache_info()
+    assert (info.hits, info.misses) == (6, 3)
+    assert info.maxsize == formats.PEP508_CACHE_SIZE
+
+
+PEP508_CORPUS = [
+    # Accepted by the fast path
+    "numpy",
+    "numpy>=1.20",
+    "numpy >= 1.20, < 2",
+    "Django==4.2.*",
+    "zope.interface~=5.4",
+    "typing_extensions>=4.0.0rc1,!=4.1.0.post1,<5.dev0",
+    "requests[security,socks]>=2.8.1",
+    "requests [ security , socks ] == 2.8.1",
+    "a",
+    "1",
+    # Checked with ``packaging``
+    "numpy>=1.20; python_version < '3.12'",
+    "pip @ https://github.com/pypa/pip/archive/1.3.1.zip",
+    "name (>=1.0)",
+    "name[]",
+    "name===foobar",
+    "name==1.0+local",
+    "name>=1.0.*",
+    "name~=1",
+    "name~=1.0.*",
+    "name==1.0RC1",
+    "name==v1.0",
+    " name>=1.0 ",
+    # Invalid
+    "",
+    "-name",
+    "name-",
+    "name>=",
+    "name>>1.0",
+    "name=1.0",
+    "name>=1.0,",
+    "name,>=1.0",
+    "name[extra",
+    "name[-extra]",
+    "name>=1.0; python_version",
+    "náme",
+    "name>=\u0661.0",  # Arabic-Indic digit
+]
+
+
+def _random_requirements(seed, count):
+    rng = random.Random(seed)
+    fragments = [
+        *"aZ09._-[], ;=!<>~*+@()",
+        *("a", "b", "rc", "post", "dev", ".*", "1.0", "  "),
+        *("==", "~=", ">=", "<=", "!=", "===", "numpy", "extra"),
+    ]
+    for _ in range(count):
+        size = rng.randint(1, 12)
+        yield "".join(rng.choice(fragments) for _ in range(size))
+
+
+def _packaging_accepts(value):
+    try:
+        formats._req.Requirement(value)
+    except formats._req.InvalidRequirement:
+        return False
+    return True
+
+
+@pytest.mark.parametrize("example", PEP508_CORPUS)
+def test_pep508_fast_path(example):
+    expected = _packaging_accepts(example)
+    assert formats.pep508.__wrapped__(example) is expected
+    if formats.PEP508_SIMPLE_REGEX.fullmatch(example):
+        assert expected  # no false positives
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_pep508_fast_path_randomized(seed):
+    accepted = 0
+    for example in _random_requirements(seed, 20_000):
+        if formats.PEP508_SIMPLE_REGEX.fullmatch(example):
+            accepted += 1
+            assert _packaging_accepts(example), example
+    assert accepted > 0
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"), [(None, 10), ("", 10), ("42", 42), ("-1", 0), ("x", 10)]
+)
+def test_int_from_env(monkeypatch, value, expected):
+    if value is not None:
+        monkeypatch.setenv("VALIDATE_PYPROJECT_PEP508_CACHE_SIZE", value)
+    else:
+        monkeypatch.delenv("VALIDATE_PYPROJECT_PEP508_CACHE_SIZE", raising=False)
+    assert formats._int_from_env("VALIDATE_PYPROJECT_PEP508_CACHE_SIZE", 10) == expected
+
+
 @pytest.mark.parametrize(
     "example",
     [
@@ -358,6 +557,33 @@ def test_invalid_pep639_license_expression(example):
     assert formats.SPDX(example) is False
 
 
+def test_spdx_cache(monkeypatch):
+    canonicalize = Mock(wraps=formats._licenses.canonicalize_license_expression)
+    monkeypatch.setattr(
+        formats._licenses, "canonicalize_license_expression", canonicalize
+    )
+    formats.SPDX.cache_clear()
+    for _ in range(3):
+        assert formats.SPDX("MIT")
+        assert formats.SPDX("apache-2.0")
+        assert formats.SPDX("MIT OR Apache-2.0")
+        assert formats.SPDX("MIT+ OR") is False  # invalid results are cached
+    assert canonicalize.call_count == 2  # single identifiers: exact-match fast path
+    info = formats.SPDX.cache_info()
+    assert (info.hits, info.misses) == (8, 4)
+    assert info.maxsize == formats.SPDX_CACHE_SIZE
+
+
+def test_spdx_fast_path():
+    # The fast path should agree with ``packaging`` for every known identifier
+    licenses = formats._licenses
+    for key in formats._SPDX_IDS:
+        for value in (key, key.upper(), formats._SPDX_LICENSES[key]["id"]):
+            assert formats.SPDX.__wrapped__(value) is True
+            assert licenses.canonicalize_license_expression(value)
+    assert len(formats._SPDX_IDS) > 500
+
+
 class TestClassifiers:
     """The ``_TroveClassifier`` class and ``_download_classifiers`` are part of the
     private API and therefore need to be tested.
@@ -457,7 +683,7 @@ class TestClassifiers:
         assert not validator.downloaded
 
     def test_always_valid_after_download_error(self, monkeypatch):
-        def _failed_download():
+        def _failed_download(_validators=None):
             raise OSError()
 
         monkeypatch.setattr(formats, "_download_classifiers", _failed_download)
@@ -467,6 +693,96 @@ class TestClassifiers:
         assert validator("Other Made Up :: Classifier") is True
         assert not validator.downloaded
 
+    def test_persistent_cache(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("VALIDATE_PYPROJECT_CACHE_DIR", str(tmp_path))
+        downloader = Mock(return_value="\n".join(self.VALID_CLASSIFIERS))
+        monkeypatch.setattr(formats, "_download_classifiers", downloader)
+        assert formats._TroveClassifier()("Made Up :: Classifier") is False
+        downloader.assert_called_once()
+
+        # New processes reuse the downloaded list (even without network access)
+        monkeypatch.setenv("NO_NETWORK", "1")
+        for classifier in self.VALID_CLASSIFIERS:
+            assert formats._TroveClassifier()(classifier) is True
+        assert formats._TroveClassifier()("Made Up :: Classifier") is False
+        downloader.assert_called_once()
+
+    def test_conditional_download(self, monkeypatch):
+        import urllib.request
+        from email.message import Message
+        from urllib.error import HTTPError
+
+        def _urlopen(request, **_kwargs):
+            if request.get_header("If-none-match") == '"v1"':
+                raise HTTPError(request.full_url, 304, "Not Modified", Message(), None)
+            response = Mock(read=lambda: b"Framework :: Django")
+            response.getheader = {"ETag": '"v1"'}.get
+            response.__enter__ = lambda self: self
+            response.__exit__ = Mock(return_value=False)
+            return response
+
+        monkeypatch.setattr(urllib.request, "urlopen", _urlopen)
+        validators = {}
+        assert formats._download_classifiers(validators) == "Framework :: Django"
+        assert validators == {"ETag": '"v1"'}
+        with pytest.raises(caching.NotModified):
+            formats._download_classifiers(validators)
+
+
+PYTHON3 = "Programming Language :: Python :: 3"
+KNOWN_CLASSIFIERS = frozenset(
+    (
+        "Framework :: Django",
+        "Framework :: Django :: 4.2",
+        "Framework :: Flask",
+        "License :: OSI Approved :: MIT License",
+        "License :: OSI Approved :: Apache Software License",
+        "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3 :: Only",
+    )
+)
+
+
+class TestClassifierIndex:
+    @pytest.fixture(autouse=True)
+    def known(self, monkeypatch):
+        monkeypatch.setattr(formats, "_known_classifiers", lambda: KNOWN_CLASSIFIERS)
+
+    def test_invalid_classifiers(self):
+        values = [
+            "Framework :: Django",
+            "Framework :: Djnago",
+            "private :: x",
+            "PRIVATE :: y",
+            "Private:: z",
+            "Programming Language :: Python :: 3 :: only",
+        ]
+        assert formats._invalid_classifiers(values) == [values[1], *values[-2:]]
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (
+                "Framework :: Djnago",
+                ["Framework :: Django", "Framework :: Django :: 4.2"],
+            ),
+            ("framework::flask", ["Framework :: Flask"]),
+            (
+                "License :: OSI Approved :: MIT",
+                ["License :: OSI Approved :: MIT License"],
+            ),
+            ("Programming Language :: Pyhton", [PYTHON3, f"{PYTHON3} :: Only"]),
+            ("Topic :: Nonsense", []),
+        ],
+    )
+    def test_suggest_classifiers(self, value, expected):
+        assert formats._suggest_classifiers(value, limit=2) == expected
+
+    def test_unavailable(self, monkeypatch):
+        monkeypatch.setattr(formats, "_known_classifiers", lambda: None)
+        assert formats._invalid_classifiers(["Made Up :: Classifier"]) == []
+        assert formats._suggest_classifiers("Made Up :: Classifier") == []
+
 
 def test_private_classifier():
     assert formats.trove_classifier("private :: Keep Off PyPI") is True
@@ -3,11 +3,13 @@
 # The original PyScaffold license can be found in 'NOTICE.txt'
 from __future__ import annotations
 
+import os
 import sys
 from collections import defaultdict
 from importlib.metadata import EntryPoint
 from types import ModuleType
 from typing import Callable, TypeVar
+from unittest.mock import Mock
 
 import pytest
 
@@ -45,6 +47,38 @@ def test_iterate_entry_points():
         assert ext in name_list
 
 
+class TestEntryPointsCache:
+    def names(self, group):
+        return sorted(e.name for e in plugins.iterate_entry_points(group))
+
+    def test_cache(self, tmp_path, monkeypatch):
+        group = "validate_pyproject.tool_schema"
+        monkeypatch.setenv("VALIDATE_PYPROJECT_CACHE_DIR", str(tmp_path))
+        monkeypatch.syspath_prepend(str(tmp_path / "site"))
+        (tmp_path / "site").mkdir()
+
+        expected = self.names(group)
+        assert set(EXISTING) <= set(expected)
+        assert len(list((tmp_path / "entry-points").glob("*.json"))) == 1
+
+        # Warm runs should not scan sys.path again
+        scan = Mock(side_effect=RuntimeError("should not be called"))
+        monkeypatch.setattr(plugins, "entry_points", scan)
+        assert self.names(group) == expected
+        assert all(is_entry_point(e) for e in plugins.iterate_entry_points(group))
+
+        # Changes in the directories in sys.path invalidate the cache
+        (tmp_path / "site/new-dist-info").mkdir()
+        os.utime(tmp_path / "site", ns=(0, 0))
+        with pytest.raises(RuntimeError, match="should not be called"):
+            self.names(group)
+
+    def test_uncached_groups(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("VALIDATE_PYPROJECT_CACHE_DIR", str(tmp_path))
+        assert self.names("console_scripts")
+        assert not (tmp_path / "entry-points").exists()
+
+
 def test_list_from_entry_points():
     # Should return a list with all the plugins registered in the entrypoints
     plugin_list = plugins.list_from_entry_points()
@@ -77,6 +111,13 @@ class TestPluginWrapper:
         pw = plugins.PluginWrapper("name", _fn2)
         assert pw.help_text == "Help for `name`"
 
+    def test_schema_loaded_once(self):
+        load_fn = Mock(return_value={"$id": "http://example.com/schema.json"})
+        pw = plugins.PluginWrapper("name", load_fn)
+        load_fn.assert_not_called()
+        assert pw.schema is pw.schema
+        load_fn.assert_called_once_with("name")
+
 
 class TestStoredPlugin:
     def test_empty_help_text(self):
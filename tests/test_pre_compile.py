@@ -6,12 +6,14 @@ import subprocess
 import sys
 from inspect import cleandoc
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 from fastjsonschema import JsonSchemaValueException
 
 from validate_pyproject import _tomllib as tomllib
-from validate_pyproject.pre_compile import cli, pre_compile
+from validate_pyproject import api, plugins
+from validate_pyproject.pre_compile import bundle, cli, pre_compile
 
 from .helpers import error_file, get_tools, get_tools_as_args
 
@@ -30,6 +32,7 @@ def _pre_compile_checks(path: Path):
         ("fastjsonschema_validations.py", "def validate("),
         ("extra_validations.py", "def validate"),
         ("formats.py", "def pep508("),
+        ("caching.py", "def cached_download("),
         ("NOTICE", "The relevant copyright notes and licenses are included below"),
     ]
     for file, content in files:
@@ -63,6 +66,36 @@ def _pre_compile_checks(path: Path):
     assert re.search(error, str(exc_info.value.output, "utf-8"))
 
 
+class TestBundle:
+    @pytest.fixture
+    def builtin_plugins(self):
+        load = api.load_builtin_plugin
+        return [plugins.PluginWrapper(n, load) for n in ("distutils", "setuptools")]
+
+    @pytest.fixture
+    def bundled(self, tmp_path, monkeypatch, builtin_plugins):
+        name = f"_bundled_{tmp_path.name}"
+        bundle(tmp_path / name, builtin_plugins)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.setattr(api, "BUNDLED_MODULE", name)
+        return name
+
+    def test_used_when_plugins_match(self, bundled, builtin_plugins, monkeypatch):
+        monkeypatch.setattr(api.FJS, "compile", Mock(side_effect=RuntimeError("no!")))
+        validator = api.Validator(builtin_plugins)
+        example = {"project": {"name": "proj", "version": 42}}
+        with pytest.raises(JsonSchemaValueException, match="must be string"):
+            validator(example)
+        assert f"{bundled}.validations" in sys.modules
+
+    def test_fallback(self, bundled, builtin_plugins):
+        validator = api.Validator(builtin_plugins[:1])
+        example = {"project": {"name": "proj", "version": 42}}
+        with pytest.raises(JsonSchemaValueException, match="must be string"):
+            validator(example)
+        assert f"{bundled}.validations" not in sys.modules
+
+
 def test_pre_compile_api(tmp_path):
     path = Path(tmp_path)
     pre_compile(path, MAIN_FILE)
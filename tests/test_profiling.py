@@ -0,0 +1,72 @@
+import json
+import time
+
+import pytest
+
+from validate_pyproject import api, cli, errors, profiling
+
+from .test_cli import write_example
+
+
+def test_disabled():
+    assert not profiling.enabled()
+    with profiling.phase("noop"):
+        pass  # nothing is recorded and no error is raised
+
+    fn = str.isidentifier
+    validator = api.Validator()
+    assert validator._profiled(fn) is fn
+
+
+def test_nested_phases():
+    calls = []
+    with profiling.profile(lambda *args: calls.append(args)) as prof:
+        assert profiling.enabled()
+        with profiling.phase("outer"):
+            time.sleep(0.02)
+            for _ in range(2):
+                with profiling.phase("inner"):
+                    time.sleep(0.02)
+        with profiling.phase("outer"):
+            pass
+    assert not profiling.enabled()
+
+    assert prof.counts == {"inner": 2, "outer": 2}
+    assert [name for name, _ in calls] == ["inner", "inner", "outer", "outer"]
+    # Nested phases are excluded from the duration of the outer phase
+    assert prof.durations["inner"] >= 0.04
+    assert 0.02 <= prof.durations["outer"] < calls[2][1]
+    assert sum(prof.durations.values()) <= prof.total
+
+    data = json.loads(prof.format_json())
+    assert data["phases"]["inner"]["count"] == 2
+    table = prof.format_table().splitlines()
+    assert [line.split()[0] for line in table] == ["phase", "inner", "outer", "total"]
+
+
+def test_validator():
+    pyproject = {"project": {"name": "proj", "version": "4.2"}}
+    with profiling.profile() as prof:
+        validator = api.Validator()
+        validator(pyproject)
+        validator.is_valid(pyproject)  # not instrumented
+        with pytest.raises(errors.ValidationErrors):
+            validator({"project": {"name": 42}}, collect="all")
+
+    assert {"registry", "compile", "schema", "formats", "extra_validations"} <= set(
+        prof.counts
+    )
+    assert prof.counts["schema"] == 2
+
+
+@pytest.mark.parametrize("flag", ["--profile", "--profile-json"])
+def test_cli(tmp_path, capsys, flag):
+    example = write_example(tmp_path)
+    assert cli.run([flag, "-j", "2", str(example)]) == 0
+    captured = capsys.readouterr()
+    assert "Valid file" in captured.out
+    if flag == "--profile-json":
+        phases = json.loads(captured.err)["phases"]
+    else:
+        phases = {line.split()[0] for line in captured.err.splitlines()}
+    assert {"parse", "schema", "extra_validations"} <= set(phases)